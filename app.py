@@ -1,18 +1,68 @@
 import websocket
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import re
+import random
+import socket
+import gc
+import sys
 from datetime import datetime, timedelta, timezone
 from time import sleep
-from flask import Flask, request, render_template_string, redirect
+from flask import Flask, Response, request, render_template, redirect
+from jinja2 import ChoiceLoader, DictLoader
 import threading
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import bisect
+import atexit
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional
 import time as time_module
+from functools import lru_cache
+
+# Fast JSON for the WebSocket feed and REST bodies, with stdlib fallback.
+# json_loads accepts bytes, so REST callers pass response.content directly.
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
 
 # Initialize Flask app
 app = Flask(__name__)
 
+# -------------------------------
+# Logging
+# -------------------------------
+# Records are queued and written to stdout by a listener thread, so bot and
+# request threads never block on console I/O
+log = logging.getLogger("delta_arbitrage_bot")
+# An unrecognised LOG_LEVEL falls back to INFO (warned below) rather than failing at import
+LOG_LEVEL = (os.getenv("LOG_LEVEL") or "INFO").upper()
+LOG_LEVEL_KNOWN = LOG_LEVEL in logging.getLevelNamesMapping()
+log.setLevel(LOG_LEVEL if LOG_LEVEL_KNOWN else logging.INFO)
+log.propagate = False
+log_queue = queue.SimpleQueue()
+log.addHandler(QueueHandler(log_queue))
+
+log_stream_handler = logging.StreamHandler(sys.stdout)
+log_stream_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
+log_listener = QueueListener(log_queue, log_stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+if not LOG_LEVEL_KNOWN:
+    log.warning(f"⚠️ Unknown LOG_LEVEL {LOG_LEVEL!r}, using INFO")
+
 # -------------------------------
 # Configuration & Global State
 # -------------------------------
@@ -22,14 +72,115 @@ TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 # Global thresholds for arbitrage system
 DELTA_THRESHOLD = {"ETH": 0.16, "BTC": 2}
 ALERT_COOLDOWN = 60
+ALERT_COOLDOWN_NS = ALERT_COOLDOWN * 1_000_000_000  # can_alert works in monotonic_ns
+ALERT_KEY_LIMIT = 10_000  # cap on remembered alert keys per bot
 PROCESS_INTERVAL = 2
+ARBITRAGE_FULL_SCAN_INTERVAL = 10  # ETH scans only ticked strikes in between
 EXPIRY_CHECK_INTERVAL = 60
 BTC_FETCH_INTERVAL = 1
 
+# ETH WebSocket liveness: app-level ping/pong plus kernel TCP keepalive, and
+# exponential backoff (with jitter) between reconnect attempts
+WS_PING_INTERVAL = 20
+WS_PING_TIMEOUT = 10
+WS_RECONNECT_MAX_DELAY = 60
+WS_SOCKOPT = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Linux-only options
+    WS_SOCKOPT += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4)
+    ]
+WS_SOCKOPT = tuple(WS_SOCKOPT)
+
+# Frame-level tracing is far too chatty for the live ticker feed; opt in with DEBUG_WS=1
+websocket.enableTrace(os.getenv("DEBUG_WS") == "1")
+
+# Persistent HTTP sessions (keep-alive, reused TLS connections). Delta and
+# Telegram get separate pools so Delta polling never evicts the Telegram socket.
+delta_session = requests.Session()
+delta_session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.1)
+))
+
+# (connect, read) seconds: a dead host fails fast on connect while slow
+# responses still get the full read budget
+DELTA_TIMEOUT = (3, 10)
+DELTA_ORDERBOOK_TIMEOUT = (3, 5)
+
+telegram_session = requests.Session()
+telegram_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+# Short-lived cache of Delta REST responses. The generation is part of the key
+# so bumping it on expiry rollover invalidates everything, including entries
+# stored by requests that were already in flight.
+PRODUCTS_CACHE_TTL = 120  # listings change a few times a day; rollover bumps the generation anyway
+api_cache = {}
+api_cache_lock = threading.Lock()
+api_cache_generation = 0
+
+def get_json_cached(url, params=None, ttl=PRODUCTS_CACHE_TTL, timeout=DELTA_TIMEOUT):
+    """GET a Delta endpoint, serving repeat calls within ttl from memory.
+    Returns the decoded JSON body, or None on a non-200 response."""
+    key = (api_cache_generation, url, frozenset(params.items()) if params else None)
+    now = time_module.monotonic()
+    with api_cache_lock:
+        entry = api_cache.get(key)
+    if entry and now - entry[0] < ttl:
+        return entry[1]
+    
+    response = delta_session.get(url, params=params, timeout=timeout)
+    if response.status_code != 200:
+        return None
+    data = json_loads(response.content)
+    with api_cache_lock:
+        api_cache[key] = (now, data)
+    return data
+
+def invalidate_api_cache():
+    """Drop cached REST responses (called on expiry rollover)"""
+    global api_cache_generation
+    with api_cache_lock:
+        api_cache_generation += 1
+        api_cache.clear()
+
+LIVE_OPTIONS_URL = "https://api.india.delta.exchange/v2/products"
+LIVE_OPTIONS_PARAMS = {
+    'contract_types': 'call_options,put_options',
+    'states': 'live'
+}
+
+def fetch_live_option_products():
+    """Live option products for every underlying, shared by both bots through the cache.
+    Returns None if the API call fails."""
+    data = get_json_cached(LIVE_OPTIONS_URL, LIVE_OPTIONS_PARAMS)
+    if data is None:
+        return None
+    return data.get('result', [])
+
+def expiry_sort_key(expiry):
+    """DDMMYY -> YYMMDD, so expiry codes sort by date rather than by day of month"""
+    return expiry[4:6] + expiry[2:4] + expiry[:2]
+
+def get_live_expiries(asset):
+    """Expiries (in date order) that currently have live options for the given underlying"""
+    products = fetch_live_option_products()
+    if not products:
+        return []
+    
+    expiries = set()
+    for product in products:
+        meta = parse_symbol(product.get('symbol', ''))
+        if meta and meta[1] == asset:
+            expiries.add(meta[3])
+    return sorted(expiries, key=expiry_sort_key)
+
 # -------------------------------
 # System 2: Option Alert Configuration
 # -------------------------------
-@dataclass
+@dataclass(slots=True)
 class AlertConfig:
     strike: float = 0
     premium: float = 0
@@ -55,7 +206,7 @@ last_check_time = None
 # -------------------------------
 # System 3: Dual Condition Spike Detection Configuration
 # -------------------------------
-@dataclass
+@dataclass(slots=True)
 class SpikeConfig:
     # Condition 1: Price Spike
     enabled_spike: bool = False
@@ -83,69 +234,267 @@ last_spread_alert = {}  # symbol: timestamp for Condition 2
 
 # Fixed cooldown for both conditions (2 minutes)
 SPIKE_COOLDOWN_SECONDS = 120
+SPIKE_COOLDOWN_DISPLAY = f"{SPIKE_COOLDOWN_SECONDS} seconds ({SPIKE_COOLDOWN_SECONDS // 60} minutes)"
+
+# -------------------------------
+# Option Quotes (shared by all systems)
+# -------------------------------
+@dataclass(slots=True)
+class OptionQuote:
+    bid: float = 0
+    ask: float = 0
+    symbol: str = ""
+
+# Placeholder for a strike side with no quote yet
+EMPTY_QUOTE = OptionQuote()
+
+def to_price(value):
+    """Quote field as a float; missing, empty or None counts as 0"""
+    return float(value) if value else 0.0
+
+# -------------------------------
+# Telegram Delivery Queue
+# -------------------------------
+# Alerts are queued and sent by a background thread so bot loops never block on HTTP
+telegram_queue = queue.Queue(maxsize=1024)
+TELEGRAM_FLUSH_INTERVAL = 0.5  # seconds to wait while collecting a batch
+TELEGRAM_BATCH_SIZE = 10
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+TELEGRAM_BATCH_SEPARATOR = "\n---\n"
+TELEGRAM_TIMEOUT = (2, 5)  # (connect, read) seconds; caps how long one send holds the sender
+
+# Telegram bot limits: 30 messages/second overall, about 1/second per chat
+TELEGRAM_GLOBAL_RATE = 30
+TELEGRAM_CHAT_INTERVAL = 1.0
+TELEGRAM_MAX_RETRY_AFTER = 60  # cap on a 429's retry_after, in seconds
+telegram_rate_lock = threading.Lock()  # the sender thread and the exit flush both send
+telegram_rate_state = {
+    "tokens": float(TELEGRAM_GLOBAL_RATE),
+    "refilled_at": time_module.monotonic(),
+    "last_chat_send": 0.0
+}
 
 # -------------------------------
 # Utility Functions
 # -------------------------------
+IST_OFFSET = timedelta(hours=5, minutes=30)
+IST_OFFSET_SECONDS = int(IST_OFFSET.total_seconds())
+
+# Initial "last run" value for monotonic rate-limit checks, so they fire immediately
+NEVER = float("-inf")
+
+# (formatted IST time, epoch second it was formatted for)
+ist_time_cache = ("", -1)
+
 def get_ist_time():
-    """Get current time in IST correctly"""
-    utc_now = datetime.now(timezone.utc)
-    ist_offset = timedelta(hours=5, minutes=30)
-    ist_time = utc_now + ist_offset
-    return ist_time.strftime("%H:%M:%S")
+    """Get current time in IST correctly (formatted at most once per second)"""
+    global ist_time_cache
+    now = int(time_module.time())
+    if now != ist_time_cache[1]:
+        ist_time_cache = (time_module.strftime("%H:%M:%S", time_module.gmtime(now + IST_OFFSET_SECONDS)), now)
+    return ist_time_cache[0]
+
+# (formatted server-local date and time, epoch second it was formatted for)
+local_timestamp_cache = ("", -1)
+
+def get_local_timestamp():
+    """Server-local 'YYYY-MM-DD HH:MM:SS' (formatted at most once per second)"""
+    global local_timestamp_cache
+    now = int(time_module.time())
+    if now != local_timestamp_cache[1]:
+        local_timestamp_cache = (time_module.strftime("%Y-%m-%d %H:%M:%S", time_module.localtime(now)), now)
+    return local_timestamp_cache[0]
 
 def get_current_expiry():
     """Get current date in DDMMYY format"""
     utc_now = datetime.now(timezone.utc)
-    ist_now = utc_now + timedelta(hours=5, minutes=30)
+    ist_now = utc_now + IST_OFFSET
     return ist_now.strftime("%d%m%y")
 
+OPTION_CONTRACT_TYPES = frozenset(('call_options', 'put_options'))
+
+# Option symbols look like C-ETH-3200-241225: side, underlying, strike, DDMMYY expiry
+_SYMBOL_RE = re.compile(r"^([CP])-([A-Z]+)-(\d+)-(\d{6})$")
+
+@lru_cache(maxsize=4096)
+def parse_symbol(symbol):
+    """Parse an option symbol into (side, asset, strike, expiry), or None if it isn't one"""
+    match = _SYMBOL_RE.match(symbol)
+    if not match:
+        return None
+    side, asset, strike, expiry = match.groups()
+    return side, asset, int(strike), expiry
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
 def format_expiry_display(expiry_code):
     """Convert DDMMYY to DD MMM YY format"""
-    try:
-        day = expiry_code[:2]
-        month = expiry_code[2:4]
-        year = "20" + expiry_code[4:6]
-        
-        month_names = {
-            '01': 'Jan', '02': 'Feb', '03': 'Mar', '04': 'Apr',
-            '05': 'May', '06': 'Jun', '07': 'Jul', '08': 'Aug',
-            '09': 'Sep', '10': 'Oct', '11': 'Nov', '12': 'Dec'
-        }
-        
-        return f"{day} {month_names[month]} {year}"
-    except:
+    if len(expiry_code) != 6 or not expiry_code.isdigit():
+        return expiry_code
+    month = int(expiry_code[2:4])
+    if not 1 <= month <= 12:
         return expiry_code
+    return f"{expiry_code[:2]} {_MONTHS[month - 1]} 20{expiry_code[4:6]}"
 
 def send_telegram(message):
-    """Send Telegram message"""
+    """Queue Telegram message for the background sender (the oldest one is dropped when full)"""
+    try:
+        telegram_queue.put_nowait(message)
+    except queue.Full:
+        try:
+            telegram_queue.get_nowait()
+        except queue.Empty:
+            pass
+        log.warning("⚠️ Telegram queue full, dropping oldest message")
+        try:
+            telegram_queue.put_nowait(message)
+        except queue.Full:
+            pass
+
+def wait_for_telegram_slot():
+    """Block until a send fits both the global token bucket and the per-chat interval"""
+    state = telegram_rate_state
+    while True:
+        with telegram_rate_lock:
+            now = time_module.monotonic()
+            elapsed = now - state["refilled_at"]
+            state["tokens"] = min(TELEGRAM_GLOBAL_RATE, state["tokens"] + elapsed * TELEGRAM_GLOBAL_RATE)
+            state["refilled_at"] = now
+            
+            wait = max(
+                (1 - state["tokens"]) / TELEGRAM_GLOBAL_RATE,
+                state["last_chat_send"] + TELEGRAM_CHAT_INTERVAL - now
+            )
+            if wait <= 0:
+                state["tokens"] -= 1
+                state["last_chat_send"] = now
+                return
+        sleep(wait)
+
+def post_telegram(message):
+    """Send Telegram message (blocking, used by the sender thread)"""
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        print(f"[{datetime.now()}] 📱 Telegram not configured: {message}")
+        log.info(f"📱 Telegram not configured: {message}")
         return
-    try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        resp = requests.post(url, data={
-            "chat_id": TELEGRAM_CHAT_ID, 
-            "text": message, 
-            "parse_mode": "Markdown"
-        })
+    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    data = {
+        "chat_id": TELEGRAM_CHAT_ID, 
+        "text": message, 
+        "parse_mode": "Markdown"
+    }
+    for attempt in range(3):
+        wait_for_telegram_slot()
+        try:
+            resp = telegram_session.post(url, data=data, timeout=TELEGRAM_TIMEOUT)
+        except Exception as e:
+            log.error(f"❌ Telegram error: {e}")
+            return
+        
         if resp.status_code == 200:
-            print(f"[{datetime.now()}] 📱 Telegram alert sent")
-        else:
-            print(f"[{datetime.now()}] ❌ Telegram error {resp.status_code}")
-    except Exception as e:
-        print(f"[{datetime.now()}] ❌ Telegram error: {e}")
+            log.info("📱 Telegram alert sent")
+            return
+        if resp.status_code == 400 and "parse_mode" in data:
+            # Usually unbalanced Markdown; in a batch one bad alert would sink them all
+            log.warning("⚠️ Telegram rejected Markdown, resending as plain text")
+            del data["parse_mode"]
+            continue
+        if resp.status_code == 429:
+            # Flood control: Telegram says how long to back off
+            try:
+                retry_after = float(resp.json().get("parameters", {}).get("retry_after", 1))
+            except (ValueError, TypeError, AttributeError):
+                retry_after = 1
+            # A bogus value (negative, NaN, hours) must not crash or stall the sender
+            retry_after = min(retry_after, TELEGRAM_MAX_RETRY_AFTER) if retry_after > 0 else 1
+            log.warning(f"⚠️ Telegram rate limited, retrying in {retry_after}s")
+            sleep(retry_after)
+            continue
+        log.error(f"❌ Telegram error {resp.status_code}")
+        return
+    log.error(f"❌ Telegram error {resp.status_code}: gave up after {attempt + 1} attempts")
+
+def split_telegram_message(message, limit=TELEGRAM_MAX_MESSAGE_LENGTH):
+    """Split one message that is over Telegram's length limit, preferring line breaks"""
+    pieces = []
+    while len(message) > limit:
+        cut = message.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = limit
+        pieces.append(message[:cut])
+        message = message[cut:].lstrip("\n")
+    pieces.append(message)
+    return pieces
+
+def join_telegram_batch(messages, separator=TELEGRAM_BATCH_SEPARATOR):
+    """Join messages into as few sends as fit Telegram's length limit"""
+    chunks = []
+    current = ""
+    for part in messages:
+        for message in split_telegram_message(part):
+            if current and len(current) + len(separator) + len(message) > TELEGRAM_MAX_MESSAGE_LENGTH:
+                chunks.append(current)
+                current = message
+            elif current:
+                current += separator + message
+            else:
+                current = message
+    if current:
+        chunks.append(current)
+    return chunks
+
+def send_telegram_alerts(alerts):
+    """Queue one cycle's alerts as a single message (split only if over the length limit)"""
+    for chunk in join_telegram_batch(alerts, "\n\n"):
+        send_telegram(chunk)
+
+def telegram_flush_loop():
+    """Drain queued messages in batches and send each batch as one message"""
+    while True:
+        batch = [telegram_queue.get()]
+        deadline = time_module.monotonic() + TELEGRAM_FLUSH_INTERVAL
+        while len(batch) < TELEGRAM_BATCH_SIZE:
+            remaining = deadline - time_module.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(telegram_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        # One bad batch must not kill the sender; later alerts would just pile up
+        try:
+            for chunk in join_telegram_batch(batch):
+                post_telegram(chunk)
+        except Exception as e:
+            log.error(f"❌ Telegram sender error: {e}")
+
+def flush_telegram_queue():
+    """Send whatever is still queued (called at exit)"""
+    batch = []
+    while True:
+        try:
+            batch.append(telegram_queue.get_nowait())
+        except queue.Empty:
+            break
+    for chunk in join_telegram_batch(batch):
+        post_telegram(chunk)
+
+def start_telegram_sender():
+    """Start the background Telegram sender thread"""
+    threading.Thread(target=telegram_flush_loop, daemon=True).start()
+    atexit.register(flush_telegram_queue)
+
+CONFIG_NAMES = {
+    'btc_call': 'BTC CALL',
+    'btc_put': 'BTC PUT',
+    'eth_call': 'ETH CALL',
+    'eth_put': 'ETH PUT'
+}
 
 def send_config_update_telegram(config_id: str, old_config: Dict, new_config: Dict):
     """Send Telegram message when config is updated"""
-    config_names = {
-        'btc_call': 'BTC CALL',
-        'btc_put': 'BTC PUT',
-        'eth_call': 'ETH CALL',
-        'eth_put': 'ETH PUT'
-    }
-    
-    asset_type = config_names.get(config_id, config_id)
+    asset_type = CONFIG_NAMES.get(config_id, config_id)
     
     # Check what changed
     changes = []
@@ -181,7 +530,7 @@ def send_config_update_telegram(config_id: str, old_config: Dict, new_config: Di
 """
     
     send_telegram(message)
-    print(f"[{datetime.now()}] 📱 Telegram config update sent for {config_id}")
+    log.info(f"📱 Telegram config update sent for {config_id}")
 
 def send_alert_triggered_telegram(alert_data: Dict):
     """Send Telegram message when alert condition is met"""
@@ -197,18 +546,23 @@ def send_alert_triggered_telegram(alert_data: Dict):
 • Current Bid: ${alert_data['bid_price']:.2f}
 • Condition: ${alert_data['bid_price']:.2f} ≥ ${alert_data['threshold']:.2f} ✅
 
-**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Time:** {get_local_timestamp()}
 """
     
     send_telegram(message)
 
+def describe_symbol(symbol):
+    """(asset, strike, CALL/PUT) for alert text"""
+    meta = parse_symbol(symbol)
+    if meta is None:
+        return ("BTC" if "BTC" in symbol else "ETH"), "Unknown", "PUT"
+    side, asset, strike, _ = meta
+    return asset, strike, ("CALL" if side == "C" else "PUT")
+
 def send_spike_alert_telegram(symbol: str, current_price: float, historical_avg: float, spike_percent: float):
     """Send Telegram message for Condition 1: Premium spike"""
     # Extract symbol info
-    parts = symbol.split('-')
-    asset = "BTC" if "BTC" in symbol else "ETH"
-    option_type = "CALL" if parts[0] == "C" else "PUT"
-    strike = parts[2] if len(parts) > 2 else "Unknown"
+    asset, strike, option_type = describe_symbol(symbol)
     
     message = f"""
 🚨 **PREMIUM SPIKE DETECTED!**
@@ -225,15 +579,12 @@ def send_spike_alert_telegram(symbol: str, current_price: float, historical_avg:
 """
     
     send_telegram(message)
-    print(f"[{datetime.now()}] 🚨 Condition 1: Spike alert sent for {symbol}: ${historical_avg:.2f} → ${current_price:.2f} (+{spike_percent:.1f}%)")
+    log.info(f"🚨 Condition 1: Spike alert sent for {symbol}: ${historical_avg:.2f} → ${current_price:.2f} (+{spike_percent:.1f}%)")
 
 def send_spread_alert_telegram(symbol: str, bid_price: float, ask_price: float, spread_percent: float):
     """Send Telegram message for Condition 2: Bid-Ask spread"""
     # Extract symbol info
-    parts = symbol.split('-')
-    asset = "BTC" if "BTC" in symbol else "ETH"
-    option_type = "CALL" if parts[0] == "C" else "PUT"
-    strike = parts[2] if len(parts) > 2 else "Unknown"
+    asset, strike, option_type = describe_symbol(symbol)
     
     message = f"""
 🚨 **BID-ASK SPREAD ALERT!**
@@ -250,29 +601,29 @@ def send_spread_alert_telegram(symbol: str, bid_price: float, ask_price: float,
 """
     
     send_telegram(message)
-    print(f"[{datetime.now()}] 🚨 Condition 2: Spread alert sent for {symbol}: Bid ${bid_price:.2f}, Ask ${ask_price:.2f}, Spread {spread_percent:.1f}%")
+    log.info(f"🚨 Condition 2: Spread alert sent for {symbol}: Bid ${bid_price:.2f}, Ask ${ask_price:.2f}, Spread {spread_percent:.1f}%")
 
 # -------------------------------
 # System 3: Dual Condition Detection Functions
 # -------------------------------
-def check_premium_spikes_eth(eth_bot):
-    """Check for both conditions in ETH options"""
+def check_premium_spikes(options_prices):
+    """Check for both conditions in one bot's option quotes (ETH and BTC share this)"""
     global price_history, last_spike_alert, last_spread_alert
     
-    for symbol, price_data in eth_bot.options_prices.items():
-        # Check if we should monitor this symbol based on asset filtering
+    for symbol, price_data in options_prices.items():
+        # Check if we should monitor this symbol based on asset/side filtering
         if not should_monitor_symbol(symbol):
             continue
         
-        current_bid = price_data['bid']
-        current_ask = price_data['ask']
+        current_bid = price_data.bid
+        current_ask = price_data.ask
         
         # Skip if no valid prices
         if current_bid <= 0 or current_ask <= 0:
             continue
         
         # CONDITION 1: PRICE SPIKE DETECTION
-        if spike_config.enabled_spike and spike_config.monitor_eth:
+        if spike_config.enabled_spike:
             # Check premium filter first
             if current_bid >= spike_config.spike_min_premium:
                 # Initialize price history for this symbol
@@ -295,8 +646,8 @@ def check_premium_spikes_eth(eth_bot):
                         
                         if spike_percent >= spike_config.min_spike_percent:
                             # Check cooldown (2 minutes fixed)
-                            now = datetime.now().timestamp()
-                            last_alert = last_spike_alert.get(symbol, 0)
+                            now = time_module.monotonic()
+                            last_alert = last_spike_alert.get(symbol, NEVER)
                             
                             if now - last_alert >= SPIKE_COOLDOWN_SECONDS:
                                 # Send alert
@@ -304,7 +655,7 @@ def check_premium_spikes_eth(eth_bot):
                                 last_spike_alert[symbol] = now
         
         # CONDITION 2: BID-ASK SPREAD DETECTION
-        if spike_config.enabled_spread and spike_config.monitor_eth:
+        if spike_config.enabled_spread:
             # Check premium filter first
             if current_bid >= spike_config.spread_min_premium:
                 if current_bid > 0:
@@ -312,96 +663,126 @@ def check_premium_spikes_eth(eth_bot):
                     
                     if spread_percent >= spike_config.min_spread_percent:
                         # Check cooldown (2 minutes fixed)
-                        now = datetime.now().timestamp()
-                        last_alert = last_spread_alert.get(symbol, 0)
+                        now = time_module.monotonic()
+                        last_alert = last_spread_alert.get(symbol, NEVER)
                         
                         if now - last_alert >= SPIKE_COOLDOWN_SECONDS:
                             # Send alert
                             send_spread_alert_telegram(symbol, current_bid, current_ask, spread_percent)
                             last_spread_alert[symbol] = now
 
-def check_premium_spikes_btc(btc_bot):
-    """Check for both conditions in BTC options"""
-    global price_history, last_spike_alert, last_spread_alert
-    
-    for symbol, price_data in btc_bot.options_prices.items():
-        # Check if we should monitor this symbol based on asset filtering
-        if not should_monitor_symbol(symbol):
-            continue
-        
-        current_bid = price_data['bid']
-        current_ask = price_data['ask']
-        
-        # Skip if no valid prices
-        if current_bid <= 0 or current_ask <= 0:
-            continue
-        
-        # CONDITION 1: PRICE SPIKE DETECTION
-        if spike_config.enabled_spike and spike_config.monitor_btc:
-            # Check premium filter first
-            if current_bid >= spike_config.spike_min_premium:
-                # Initialize price history for this symbol
-                if symbol not in price_history:
-                    price_history[symbol] = []
-                
-                # Add current price to history
-                price_history[symbol].append(current_bid)
-                
-                # Keep only last 10 prices
-                if len(price_history[symbol]) > 10:
-                    price_history[symbol] = price_history[symbol][-10:]
-                
-                # Need at least 5 prices for meaningful average
-                if len(price_history[symbol]) >= 5:
-                    historical_avg = sum(price_history[symbol][:-1]) / (len(price_history[symbol]) - 1)
-                    
-                    if historical_avg > 0:
-                        spike_percent = ((current_bid - historical_avg) / historical_avg) * 100
-                        
-                        if spike_percent >= spike_config.min_spike_percent:
-                            # Check cooldown (2 minutes fixed)
-                            now = datetime.now().timestamp()
-                            last_alert = last_spike_alert.get(symbol, 0)
-                            
-                            if now - last_alert >= SPIKE_COOLDOWN_SECONDS:
-                                # Send alert
-                                send_spike_alert_telegram(symbol, current_bid, historical_avg, spike_percent)
-                                last_spike_alert[symbol] = now
-        
-        # CONDITION 2: BID-ASK SPREAD DETECTION
-        if spike_config.enabled_spread and spike_config.monitor_btc:
-            # Check premium filter first
-            if current_bid >= spike_config.spread_min_premium:
-                if current_bid > 0:
-                    spread_percent = ((current_ask - current_bid) / current_bid) * 100
-                    
-                    if spread_percent >= spike_config.min_spread_percent:
-                        # Check cooldown (2 minutes fixed)
-                        now = datetime.now().timestamp()
-                        last_alert = last_spread_alert.get(symbol, 0)
-                        
-                        if now - last_alert >= SPIKE_COOLDOWN_SECONDS:
-                            # Send alert
-                            send_spread_alert_telegram(symbol, current_bid, current_ask, spread_percent)
-                            last_spread_alert[symbol] = now
+# System 1 alert text; calls buy the lower strike, puts the higher one
+ARBITRAGE_ALERT_TEMPLATE = (
+    "{icon} {asset} Alert {side}\n"
+    "{buy_strike} (B) → {sell_strike} (S)\n"
+    "${buy_price:.2f}    ${sell_price:.2f}\n"
+    "Profit: ${profit:.2f}\n"
+    "Quantity: {quantity} lots\n"
+    "{expiry} | {time}"
+)
+
+def adjacent_pairs(sorted_strikes, changed=None):
+    """(lower, upper) pairs of neighbouring strikes; with changed, only the pairs
+    that touch one of those strikes"""
+    if changed is None:
+        return zip(sorted_strikes, sorted_strikes[1:])
+    last = len(sorted_strikes) - 1
+    lower = set()
+    for strike in changed:
+        i = bisect.bisect_left(sorted_strikes, strike)
+        if i > 0:
+            lower.add(i - 1)
+        if i < last:
+            lower.add(i)
+    return [(sorted_strikes[i], sorted_strikes[i + 1]) for i in sorted(lower)]
+
+def find_arbitrage_pairs(pairs, strikes, threshold):
+    """Yield (side, strike1, strike2, buy_quote, sell_quote) for adjacent strike pairs whose
+    prices cross by at least threshold. Calls buy the lower strike, puts the higher one.
+    Thresholds are always positive, so "diff < 0 and |diff| >= threshold" is one compare."""
+    limit = -threshold
+    for strike1, strike2 in pairs:
+        # CALL arbitrage
+        call1 = strikes[strike1]['call']
+        call2 = strikes[strike2]['call']
+        if call1.ask > 0 and call2.bid > 0 and call1.symbol:
+            if call1.ask - call2.bid <= limit:
+                yield 'call', strike1, strike2, call1, call2
+        
+        # PUT arbitrage
+        put1 = strikes[strike1]['put']
+        put2 = strikes[strike2]['put']
+        if put1.bid > 0 and put2.ask > 0 and put2.symbol:
+            if put2.ask - put1.bid <= limit:
+                yield 'put', strike1, strike2, put2, put1
 
 def should_monitor_symbol(symbol: str) -> bool:
     """Check if symbol should be monitored based on config"""
-    if "BTC" in symbol and not spike_config.monitor_btc:
-        return False
-    if "ETH" in symbol and not spike_config.monitor_eth:
+    meta = parse_symbol(symbol)
+    if meta is None:
         return False
+    side, asset, _, _ = meta
     
-    parts = symbol.split('-')
-    if len(parts) > 0:
-        option_type = parts[0]
-        if option_type == "C" and not spike_config.monitor_calls:
-            return False
-        if option_type == "P" and not spike_config.monitor_puts:
-            return False
+    if asset == "BTC" and not spike_config.monitor_btc:
+        return False
+    if asset == "ETH" and not spike_config.monitor_eth:
+        return False
+    if side == "C" and not spike_config.monitor_calls:
+        return False
+    if side == "P" and not spike_config.monitor_puts:
+        return False
     
     return True
 
+def clear_spike_history(asset):
+    """Drop System 3 price history and cooldowns for one asset's symbols (on expiry change)"""
+    for symbol in list(price_history):
+        meta = parse_symbol(symbol)
+        if meta is None or meta[1] == asset:
+            price_history.pop(symbol, None)
+            last_spike_alert.pop(symbol, None)
+            last_spread_alert.pop(symbol, None)
+
+# -------------------------------
+# Bot Readiness (/ping)
+# -------------------------------
+# A running bot may be not-ready for this long (connecting, reconnecting, Delta
+# briefly down) before /ping reports it; a restart is only worth it after that
+PING_NOT_READY_GRACE = 300
+
+class Readiness:
+    """Ready flag for one bot plus when it last flipped"""
+    def __init__(self):
+        self.event = threading.Event()
+        self.changed_at = time_module.monotonic()
+
+    def set(self):
+        if not self.event.is_set():
+            self.changed_at = time_module.monotonic()
+            self.event.set()
+
+    def clear(self):
+        if self.event.is_set():
+            self.changed_at = time_module.monotonic()
+            self.event.clear()
+
+    def restart(self):
+        """Not ready, with the grace period starting now (bot (re)started)"""
+        self.event.clear()
+        self.changed_at = time_module.monotonic()
+
+    def is_set(self):
+        return self.event.is_set()
+
+    def wait(self, timeout=None):
+        return self.event.wait(timeout)
+
+    def not_ready_for(self):
+        """Seconds since the bot stopped being ready (0 while it is ready)"""
+        if self.event.is_set():
+            return 0
+        return time_module.monotonic() - self.changed_at
+
 # -------------------------------
 # Combined ETH WebSocket Bot (Systems 1, 2 & 3)
 # -------------------------------
@@ -409,20 +790,34 @@ class ETHWebSocketBot:
     def __init__(self):
         self.websocket_url = "wss://socket.india.delta.exchange"
         self.ws = None
-        self.last_alert_time = {}
+        self.last_alert_time = OrderedDict()  # (kind, strike, strike) -> monotonic_ns time, oldest first
         self.options_prices = {}
         self.connected = False
         self.current_expiry = get_current_expiry()
         self.active_expiry = self.get_initial_active_expiry()
         self.active_symbols = []
+        self.subscribed_symbols = frozenset()  # active-expiry symbols; ticks for anything else are dropped
+        self.subscribe_payload = None  # (symbols, serialized subscribe message), reused across reconnects
         self.should_reconnect = True
-        self.last_arbitrage_check = 0
-        self.last_expiry_check = 0
+        self.reconnect_attempt = 0
+        self.last_arbitrage_check = NEVER
+        self.last_expiry_check = NEVER
         self.message_count = 0
         self.expiry_rollover_count = 0
         self.alert_count = 0
         self.last_user_alert_check = 0
         self.last_spike_check = 0
+        self.ready = Readiness()  # Set while subscribed; cleared on disconnect
+        # Guards the quote book (prices, strike index, orderbooks, cooldowns) between
+        # the WebSocket thread and the expiry watcher's resets and sweeps
+        self.book_lock = threading.Lock()
+        
+        # System 1 strike index, maintained as quotes arrive
+        self.strikes = {}  # strike -> {'call': OptionQuote, 'put': OptionQuote}
+        self.sorted_strikes = []
+        self.symbol_meta = {}  # symbol -> (strike, side), parsed once per symbol
+        self.dirty_strikes = set()  # strikes quoted since the last scan
+        self.last_full_scan = NEVER
         
         # System 2 data
         self.option_chain_data = {'calls': {}, 'puts': {}}
@@ -431,21 +826,21 @@ class ETHWebSocketBot:
     def get_initial_active_expiry(self):
         """Determine which expiry should be active right now"""
         now = datetime.now(timezone.utc)
-        ist_now = now + timedelta(hours=5, minutes=30)
+        ist_now = now + IST_OFFSET
         
         if ist_now.hour >= 17 and ist_now.minute >= 30:
             next_day = ist_now + timedelta(days=1)
             next_expiry = next_day.strftime("%d%m%y")
-            print(f"[{datetime.now()}] 🕠 ETH: After 5:30 PM, starting with next expiry: {next_expiry}")
+            log.info(f"🕠 ETH: After 5:30 PM, starting with next expiry: {next_expiry}")
             return next_expiry
         else:
-            print(f"[{datetime.now()}] 📅 ETH: Starting with today's expiry: {self.current_expiry}")
+            log.info(f"📅 ETH: Starting with today's expiry: {self.current_expiry}")
             return self.current_expiry
 
     def should_rollover_expiry(self):
         """Check if we should move to next expiry"""
         now = datetime.now(timezone.utc)
-        ist_now = now + timedelta(hours=5, minutes=30)
+        ist_now = now + IST_OFFSET
         
         if ist_now.hour >= 17 and ist_now.minute >= 30:
             next_expiry = (ist_now + timedelta(days=1)).strftime("%d%m%y")
@@ -455,72 +850,60 @@ class ETHWebSocketBot:
     def get_available_expiries(self):
         """Get all available expiries from the API"""
         try:
-            url = "https://api.india.delta.exchange/v2/products"
-            params = {
-                'contract_types': 'call_options,put_options',
-                'states': 'live'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                products = response.json().get('result', [])
-                expiries = set()
-                
-                for product in products:
-                    symbol = product.get('symbol', '')
-                    if 'ETH' in symbol:
-                        expiry = self.extract_expiry_from_symbol(symbol)
-                        if expiry:
-                            expiries.add(expiry)
-                
-                return sorted(expiries)
-            return []
+            return get_live_expiries('ETH')
         except Exception as e:
-            print(f"[{datetime.now()}] ❌ ETH: Error fetching expiries: {e}")
+            log.error(f"❌ ETH: Error fetching expiries: {e}")
             return []
 
-    def get_next_available_expiry(self, current_expiry):
-        """Get the next available expiry after current one"""
-        available_expiries = self.get_available_expiries()
+    def get_next_available_expiry(self, current_expiry, available_expiries=None):
+        """Get the next available expiry after current one (pass available_expiries to skip the fetch)"""
+        if available_expiries is None:
+            available_expiries = self.get_available_expiries()
         if not available_expiries:
             return current_expiry
         
-        print(f"[{datetime.now()}] 📊 ETH: Available expiries: {available_expiries}")
-        
-        for expiry in available_expiries:
-            if expiry > current_expiry:
-                return expiry
+        log.info(f"📊 ETH: Available expiries: {available_expiries}")
         
+        index = bisect.bisect_right(available_expiries, expiry_sort_key(current_expiry), key=expiry_sort_key)
+        if index < len(available_expiries):
+            return available_expiries[index]
         return available_expiries[-1]
 
     def check_and_update_expiry(self):
         """Check if we need to update the active expiry"""
         global price_history, last_spike_alert, last_spread_alert
         
-        current_time = datetime.now().timestamp()
+        current_time = time_module.monotonic()
         if current_time - self.last_expiry_check >= EXPIRY_CHECK_INTERVAL:
             self.last_expiry_check = current_time
             
             current_time_str = get_ist_time()
-            print(f"[{datetime.now()}] 🔄 ETH: Checking expiry rollover... (Current: {self.active_expiry}, Time: {current_time_str})")
+            log.info(f"🔄 ETH: Checking expiry rollover... (Current: {self.active_expiry}, Time: {current_time_str})")
+            
+            # One fetch serves both the rollover and the availability checks
+            available_expiries = self.get_available_expiries()
             
             next_expiry = self.should_rollover_expiry()
             if next_expiry and next_expiry != self.active_expiry:
-                print(f"[{datetime.now()}] 🎯 ETH: EXPIRY ROLLOVER TRIGGERED!")
-                print(f"[{datetime.now()}] 📅 ETH: Changing from {self.active_expiry} to {next_expiry}")
+                log.info("🎯 ETH: EXPIRY ROLLOVER TRIGGERED!")
+                log.info(f"📅 ETH: Changing from {self.active_expiry} to {next_expiry}")
                 
-                actual_next_expiry = self.get_next_available_expiry(self.active_expiry)
+                actual_next_expiry = self.get_next_available_expiry(self.active_expiry, available_expiries)
                 
                 if actual_next_expiry != self.active_expiry:
                     self.active_expiry = actual_next_expiry
                     self.expiry_rollover_count += 1
+                    invalidate_api_cache()
                     
                     # Clear all systems' data
-                    self.options_prices = {}
-                    self.active_symbols = []
-                    self.option_chain_data = {'calls': {}, 'puts': {}}
-                    self.orderbook_data = {}
+                    with self.book_lock:
+                        self.options_prices = {}
+                        self.reset_strike_index()
+                        self.active_symbols = []
+                        self.subscribed_symbols = frozenset()
+                        self.option_chain_data = {'calls': {}, 'puts': {}}
+                        self.orderbook_data = {}
+                        self.last_alert_time = OrderedDict()  # cooldowns were for the old expiry's contracts
                     
                     # Update alert configs with new expiry
                     for config_id in alert_configs:
@@ -528,14 +911,7 @@ class ETHWebSocketBot:
                             alert_configs[config_id].active_expiry = self.active_expiry
                     
                     # Clear price history and alert timestamps for old expiry symbols
-                    old_symbols = [s for s in price_history.keys() if 'ETH' in s]
-                    for symbol in old_symbols:
-                        if symbol in price_history:
-                            del price_history[symbol]
-                        if symbol in last_spike_alert:
-                            del last_spike_alert[symbol]
-                        if symbol in last_spread_alert:
-                            del last_spread_alert[symbol]
+                    clear_spike_history("ETH")
                     
                     if self.connected and self.ws:
                         self.subscribe_to_options()
@@ -543,21 +919,25 @@ class ETHWebSocketBot:
                     send_telegram(f"🔄 ETH Expiry Rollover Complete!\n\n📅 Now monitoring: {self.active_expiry}\n⏰ Time: {current_time_str}")
                     return True
                 else:
-                    print(f"[{datetime.now()}] ⚠️ ETH: No new expiry available yet, keeping: {self.active_expiry}")
+                    log.warning(f"⚠️ ETH: No new expiry available yet, keeping: {self.active_expiry}")
             
-            available_expiries = self.get_available_expiries()
             if available_expiries and self.active_expiry not in available_expiries:
-                print(f"[{datetime.now()}] ⚠️ ETH: Current expiry {self.active_expiry} no longer available!")
-                next_available = self.get_next_available_expiry(self.active_expiry)
+                log.warning(f"⚠️ ETH: Current expiry {self.active_expiry} no longer available!")
+                next_available = self.get_next_available_expiry(self.active_expiry, available_expiries)
                 if next_available != self.active_expiry:
-                    print(f"[{datetime.now()}] 🔄 ETH: Switching to available expiry: {next_available}")
+                    log.info(f"🔄 ETH: Switching to available expiry: {next_available}")
                     self.active_expiry = next_available
                     self.expiry_rollover_count += 1
+                    invalidate_api_cache()
                     
-                    self.options_prices = {}
-                    self.active_symbols = []
-                    self.option_chain_data = {'calls': {}, 'puts': {}}
-                    self.orderbook_data = {}
+                    with self.book_lock:
+                        self.options_prices = {}
+                        self.reset_strike_index()
+                        self.active_symbols = []
+                        self.subscribed_symbols = frozenset()
+                        self.option_chain_data = {'calls': {}, 'puts': {}}
+                        self.orderbook_data = {}
+                        self.last_alert_time = OrderedDict()  # cooldowns were for the old expiry's contracts
                     
                     # Update alert configs
                     for config_id in alert_configs:
@@ -565,14 +945,7 @@ class ETHWebSocketBot:
                             alert_configs[config_id].active_expiry = self.active_expiry
                     
                     # Clear price history and alert timestamps for old expiry symbols
-                    old_symbols = [s for s in price_history.keys() if 'ETH' in s]
-                    for symbol in old_symbols:
-                        if symbol in price_history:
-                            del price_history[symbol]
-                        if symbol in last_spike_alert:
-                            del last_spike_alert[symbol]
-                        if symbol in last_spread_alert:
-                            del last_spread_alert[symbol]
+                    clear_spike_history("ETH")
                     
                     if self.connected and self.ws:
                         self.subscribe_to_options()
@@ -582,154 +955,135 @@ class ETHWebSocketBot:
         
         return False
 
-    def extract_expiry_from_symbol(self, symbol):
-        """Extract expiry date from symbol string"""
-        try:
-            parts = symbol.split('-')
-            if len(parts) >= 4:
-                return parts[3]
-            return None
-        except:
-            return None
-
-    def extract_strike(self, symbol):
-        """Extract strike price from symbol"""
-        try:
-            parts = symbol.split('-')
-            for part in parts:
-                if part.isdigit() and len(part) > 2:
-                    return int(part)
-            return 0
-        except:
-            return 0
-
     def get_all_options_symbols(self):
         """Fetch symbols for ACTIVE expiry only - ETH ONLY"""
         try:
-            print(f"[{datetime.now()}] 🔍 ETH: Fetching {self.active_expiry} expiry options symbols...")
+            log.info(f"🔍 ETH: Fetching {self.active_expiry} expiry options symbols...")
             
-            url = "https://api.india.delta.exchange/v2/products"
-            params = {
-                'contract_types': 'call_options,put_options',
-                'states': 'live'
-            }
+            products = fetch_live_option_products()
             
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                products = response.json().get('result', [])
-                symbols = []
-                
-                # Clear option chain data
-                self.option_chain_data = {'calls': {}, 'puts': {}}
+            if products is not None:
+                symbols = set()
+                calls = {}
+                puts = {}
                 
                 for product in products:
                     symbol = product.get('symbol', '')
                     contract_type = product.get('contract_type', '')
+                    meta = parse_symbol(symbol)
                     
-                    is_option = contract_type in ['call_options', 'put_options']
-                    is_eth = 'ETH' in symbol
-                    is_active_expiry = self.active_expiry in symbol
+                    is_option = contract_type in OPTION_CONTRACT_TYPES
+                    is_eth = meta is not None and meta[1] == 'ETH'
+                    is_active_expiry = meta is not None and meta[3] == self.active_expiry
                     
                     if is_option and is_eth and is_active_expiry:
-                        symbols.append(symbol)
+                        symbols.add(symbol)
                         
                         # Store strike data for dropdowns
-                        strike = self.extract_strike(symbol)
+                        strike = meta[2]
                         if strike > 0:
                             if contract_type == 'call_options':
-                                self.option_chain_data['calls'][strike] = symbol
+                                calls[strike] = symbol
                             else:
-                                self.option_chain_data['puts'][strike] = symbol
+                                puts[strike] = symbol
                 
-                # Sort strikes
-                self.option_chain_data['calls'] = dict(sorted(self.option_chain_data['calls'].items()))
-                self.option_chain_data['puts'] = dict(sorted(self.option_chain_data['puts'].items()))
+                # Sorted strikes, swapped in whole so readers never see a half-built chain
+                self.option_chain_data = {
+                    'calls': dict(sorted(calls.items())),
+                    'puts': dict(sorted(puts.items()))
+                }
                 
-                symbols = sorted(list(set(symbols)))
+                symbols = sorted(symbols)
                 
-                print(f"[{datetime.now()}] ✅ ETH: Found {len(symbols)} {self.active_expiry} expiry options symbols")
-                print(f"[{datetime.now()}] 📊 ETH: Call strikes: {len(self.option_chain_data['calls'])}, Put strikes: {len(self.option_chain_data['puts'])}")
+                log.info(f"✅ ETH: Found {len(symbols)} {self.active_expiry} expiry options symbols")
+                log.info(f"📊 ETH: Call strikes: {len(self.option_chain_data['calls'])}, Put strikes: {len(self.option_chain_data['puts'])}")
                 
                 if not symbols:
                     available_expiries = self.get_available_expiries()
-                    print(f"[{datetime.now()}] ⚠️ ETH: No symbols found for {self.active_expiry}")
-                    print(f"[{datetime.now()}] 📅 ETH: Available expiries: {available_expiries}")
+                    log.warning(f"⚠️ ETH: No symbols found for {self.active_expiry}")
+                    log.info(f"📅 ETH: Available expiries: {available_expiries}")
                     if available_expiries:
-                        next_expiry = self.get_next_available_expiry(self.active_expiry)
+                        next_expiry = self.get_next_available_expiry(self.active_expiry, available_expiries)
                         if next_expiry != self.active_expiry:
-                            print(f"[{datetime.now()}] 🔄 ETH: Auto-switching to available expiry: {next_expiry}")
+                            log.info(f"🔄 ETH: Auto-switching to available expiry: {next_expiry}")
                             self.active_expiry = next_expiry
                             return self.get_all_options_symbols()
                 
                 return symbols
             else:
-                print(f"[{datetime.now()}] ❌ ETH: API Error: {response.status_code}")
+                log.error("❌ ETH: API Error fetching products")
                 return []
                 
         except Exception as e:
-            print(f"[{datetime.now()}] ❌ ETH: Error fetching symbols: {e}")
+            log.error(f"❌ ETH: Error fetching symbols: {e}")
             return []
 
     # WebSocket Callbacks
     def on_open(self, ws):
         self.connected = True
-        print(f"[{datetime.now()}] ✅ ETH: Connected to WebSocket")
-        print(f"[{datetime.now()}] 📅 ETH: Active expiry: {self.active_expiry}")
+        self.reconnect_attempt = 0
+        log.info("✅ ETH: Connected to WebSocket")
+        log.info(f"📅 ETH: Active expiry: {self.active_expiry}")
         self.subscribe_to_options()
 
     def on_close(self, ws, close_status_code, close_msg):
         self.connected = False
-        print(f"[{datetime.now()}] 🔴 ETH: WebSocket closed")
-        if self.should_reconnect:
-            print(f"[{datetime.now()}] 🔄 ETH: Reconnecting in 10 seconds...")
-            sleep(10)
-            self.connect()
+        self.ready.clear()
+        log.info("🔴 ETH: WebSocket closed")
 
     def on_error(self, ws, error):
-        print(f"[{datetime.now()}] ❌ ETH: WebSocket error: {error}")
+        log.error(f"❌ ETH: WebSocket error: {error}")
 
     def on_message(self, ws, message):
         """Handle incoming WebSocket messages - ALL SYSTEMS"""
+        self.message_count += 1
+        
+        if self.message_count & 1023 == 0:
+            log.debug(f"📨 ETH: Message {self.message_count}")
+        
+        # Heartbeats and other control frames carry no symbol; of those only the
+        # subscriptions ack is worth decoding. With UTF-8 validation skipped,
+        # websocket-client hands text frames over as bytes.
+        if isinstance(message, bytes):
+            if b'"symbol"' not in message and b'"subscriptions"' not in message:
+                return
+        elif '"symbol"' not in message and '"subscriptions"' not in message:
+            return
+        
+        # Only decoding can fail here; the handlers below catch their own errors
         try:
-            # Check expiry rollover
-            self.check_and_update_expiry()
-            
-            message_json = json.loads(message)
-            message_type = message_json.get('type')
-            
-            self.message_count += 1
-            
-            if self.message_count % 100 == 0:
-                print(f"[{datetime.now()}] 📨 ETH: Message {self.message_count}")
-            
-            if message_type == 'l1_orderbook':
+            message_json = json_loads(message)
+        except ValueError as e:
+            log.error(f"❌ ETH: Undecodable message: {e}")
+            return
+        
+        message_type = message_json.get('type')
+        
+        if message_type == 'l1_orderbook':
+            with self.book_lock:
                 self.process_l1_orderbook_data(message_json)
-            elif message_type == 'l2_orderbook' or message_type == 'order_book':
-                # Store full orderbook for quantity checks
+        elif message_type == 'l2_orderbook' or message_type == 'order_book':
+            # Store full orderbook for quantity checks
+            with self.book_lock:
                 self.process_orderbook_data(message_json)
-            elif message_type == 'subscriptions':
-                print(f"[{datetime.now()}] ✅ ETH: Subscriptions confirmed for {self.active_expiry}")
-                
-        except Exception as e:
-            print(f"[{datetime.now()}] ❌ ETH: Message processing error: {e}")
+        elif message_type == 'subscriptions':
+            log.info(f"✅ ETH: Subscriptions confirmed for {self.active_expiry}")
 
     def process_orderbook_data(self, message):
         """Process orderbook data for quantity checks"""
         try:
             symbol = message.get('symbol')
-            if not symbol or 'ETH' not in symbol:
+            if not symbol:
                 return
                 
-            symbol_expiry = self.extract_expiry_from_symbol(symbol)
-            if symbol_expiry != self.active_expiry:
+            if symbol not in self.subscribed_symbols:
                 return
             
             # Store orderbook data for quantity checks
             self.orderbook_data[symbol] = message
             
         except Exception as e:
-            print(f"[{datetime.now()}] ❌ ETH: Error processing orderbook data: {e}")
+            log.error(f"❌ ETH: Error processing orderbook data: {e}")
 
     def get_ask_quantity(self, symbol):
         """Get ask quantity from orderbook data"""
@@ -753,7 +1107,7 @@ class ETHWebSocketBot:
                             return float(best_ask[1])
                 
         except Exception as e:
-            print(f"[{datetime.now()}] ⚠️ ETH: Error getting ask quantity for {symbol}: {e}")
+            log.warning(f"⚠️ ETH: Error getting ask quantity for {symbol}: {e}")
         
         return 0
 
@@ -765,24 +1119,21 @@ class ETHWebSocketBot:
             best_ask = message.get('best_ask')
             
             if symbol and best_bid is not None and best_ask is not None:
-                if 'ETH' not in symbol:
-                    return
-                    
-                symbol_expiry = self.extract_expiry_from_symbol(symbol)
-                if symbol_expiry != self.active_expiry:
+                if symbol not in self.subscribed_symbols:
                     return
                 
-                best_bid_price = float(best_bid) if best_bid else 0
-                best_ask_price = float(best_ask) if best_ask else 0
+                best_bid_price = to_price(best_bid)
+                best_ask_price = to_price(best_ask)
                 
-                # Store data for ALL systems
-                self.options_prices[symbol] = {
-                    'bid': best_bid_price,
-                    'ask': best_ask_price,
-                    'symbol': symbol
-                }
+                # Store data for ALL systems; repeats of the current quote leave the
+                # strike clean so the next scan can skip it
+                prev = self.options_prices.get(symbol)
+                if prev is None or prev.bid != best_bid_price or prev.ask != best_ask_price:
+                    quote = OptionQuote(best_bid_price, best_ask_price, symbol)
+                    self.options_prices[symbol] = quote
+                    self.index_quote(symbol, quote)
                 
-                current_time = datetime.now().timestamp()
+                current_time = time_module.monotonic()
                 
                 # Check ALL systems (every 2 seconds)
                 if current_time - self.last_arbitrage_check >= PROCESS_INTERVAL:
@@ -793,210 +1144,241 @@ class ETHWebSocketBot:
                     self.check_user_alerts()
                     
                     # SYSTEM 3: Dual condition detection
-                    check_premium_spikes_eth(self)
+                    check_premium_spikes(self.options_prices)
                     
                     self.last_arbitrage_check = current_time
                     global last_check_time
                     last_check_time = datetime.now()
                 
         except Exception as e:
-            print(f"[{datetime.now()}] ❌ ETH: Error processing l1_orderbook data: {e}")
+            log.error(f"❌ ETH: Error processing l1_orderbook data: {e}")
 
     def check_user_alerts(self):
         """SYSTEM 2: Check for user-configured alerts"""
         if not new_system_active:
             return
         
+        tick_ts = time_module.monotonic_ns()
+        
         # Check ETH calls
         eth_call_config = alert_configs['eth_call']
         if eth_call_config.is_monitoring and eth_call_config.strike > 0 and eth_call_config.premium > 0:
             alerts = []
+            config_strike = eth_call_config.strike
+            min_premium = eth_call_config.premium
             for strike, symbol in self.option_chain_data['calls'].items():
-                if strike > eth_call_config.strike:
+                if strike > config_strike:
                     price_data = self.options_prices.get(symbol)
-                    if price_data and price_data['bid'] >= eth_call_config.premium:
-                        alert_key = f"ETH_CALL_ALERT_{strike}_{eth_call_config.strike}"
-                        if self.can_alert(alert_key):
+                    if price_data and price_data.bid >= min_premium:
+                        alert_key = ('call_alert', strike, config_strike)
+                        if self.can_alert(alert_key, tick_ts):
                             alerts.append({
                                 'asset': 'ETH',
                                 'type': 'call',
                                 'trigger_strike': strike,
-                                'bid_price': price_data['bid'],
-                                'config_strike': eth_call_config.strike,
-                                'threshold': eth_call_config.premium
+                                'bid_price': price_data.bid,
+                                'config_strike': config_strike,
+                                'threshold': min_premium
                             })
             
             for alert in alerts:
                 send_alert_triggered_telegram(alert)
-                print(f"[{datetime.now()}] 🚨 ETH CALL Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
+                log.info(f"🚨 ETH CALL Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
         
         # Check ETH puts
         eth_put_config = alert_configs['eth_put']
         if eth_put_config.is_monitoring and eth_put_config.strike > 0 and eth_put_config.premium > 0:
             alerts = []
+            config_strike = eth_put_config.strike
+            min_premium = eth_put_config.premium
             for strike, symbol in self.option_chain_data['puts'].items():
-                if strike < eth_put_config.strike:
+                if strike < config_strike:
                     price_data = self.options_prices.get(symbol)
-                    if price_data and price_data['bid'] >= eth_put_config.premium:
-                        alert_key = f"ETH_PUT_ALERT_{strike}_{eth_put_config.strike}"
-                        if self.can_alert(alert_key):
+                    if price_data and price_data.bid >= min_premium:
+                        alert_key = ('put_alert', strike, config_strike)
+                        if self.can_alert(alert_key, tick_ts):
                             alerts.append({
                                 'asset': 'ETH',
                                 'type': 'put',
                                 'trigger_strike': strike,
-                                'bid_price': price_data['bid'],
-                                'config_strike': eth_put_config.strike,
-                                'threshold': eth_put_config.premium
+                                'bid_price': price_data.bid,
+                                'config_strike': config_strike,
+                                'threshold': min_premium
                             })
             
             for alert in alerts:
                 send_alert_triggered_telegram(alert)
-                print(f"[{datetime.now()}] 🚨 ETH PUT Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
+                log.info(f"🚨 ETH PUT Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
+
+    def reset_strike_index(self):
+        """Drop the System 1 strike index (on expiry change)"""
+        self.strikes = {}
+        self.sorted_strikes = []
+        self.symbol_meta = {}
+        self.dirty_strikes = set()
+        self.last_full_scan = NEVER
+
+    def cache_symbol_meta(self, symbol):
+        """(strike, side) for symbol, parsed once and kept in symbol_meta; None if not an option"""
+        meta = self.symbol_meta.get(symbol)
+        if meta is None:
+            parsed = parse_symbol(symbol)
+            if parsed is None:
+                return None
+            meta = self.symbol_meta[symbol] = (parsed[2], 'call' if parsed[0] == 'C' else 'put')
+        return meta
+
+    def index_quote(self, symbol, quote):
+        """Update the strike index in place for one incoming quote"""
+        meta = self.cache_symbol_meta(symbol)
+        if meta is None:
+            return
+        
+        strike, side = meta
+        if strike <= 0:
+            return
+        
+        if strike not in self.strikes:
+            self.strikes[strike] = {'call': EMPTY_QUOTE, 'put': EMPTY_QUOTE}
+            bisect.insort(self.sorted_strikes, strike)
+        self.strikes[strike][side] = quote
+        # A leg with no price can't complete an arbitrage pair, so it doesn't need a rescan
+        if quote.bid > 0 or quote.ask > 0:
+            self.dirty_strikes.add(strike)
 
     def check_arbitrage_opportunities(self):
         """SYSTEM 1: Check for arbitrage opportunities - ONLY ETH"""
         if len(self.options_prices) < 10:
             return
-            
-        eth_options = []
-        
-        for symbol, prices in self.options_prices.items():
-            if 'ETH' in symbol:
-                option_data = {
-                    'symbol': symbol,
-                    'bid': prices['bid'],
-                    'ask': prices['ask']
-                }
-                eth_options.append(option_data)
         
-        if eth_options:
-            self.check_arbitrage_same_expiry(eth_options)
+        self.check_arbitrage_same_expiry()
 
-    def check_arbitrage_same_expiry(self, options):
+    def check_arbitrage_same_expiry(self):
         """SYSTEM 1: Check for arbitrage opportunities within ACTIVE expiry"""
-        strikes = {}
-        for option in options:
-            strike = self.extract_strike(option['symbol'])
-            if strike > 0:
-                if strike not in strikes:
-                    strikes[strike] = {'call': {}, 'put': {}}
-                
-                if 'C-' in option['symbol']:
-                    strikes[strike]['call'] = {
-                        'bid': option['bid'], 
-                        'ask': option['ask'],
-                        'symbol': option['symbol']
-                    }
-                elif 'P-' in option['symbol']:
-                    strikes[strike]['put'] = {
-                        'bid': option['bid'], 
-                        'ask': option['ask'],
-                        'symbol': option['symbol']
-                    }
-        
-        sorted_strikes = sorted(strikes.keys())
+        strikes = self.strikes
+        sorted_strikes = self.sorted_strikes
         
         if len(sorted_strikes) < 2:
             return
         
-        alerts = []
+        # Only pairs next to a ticked strike can have changed; a periodic full
+        # pass still re-alerts standing opportunities once their cooldown ends
+        now = time_module.monotonic()
+        if now - self.last_full_scan >= ARBITRAGE_FULL_SCAN_INTERVAL:
+            pairs = adjacent_pairs(sorted_strikes)
+            self.last_full_scan = now
+        elif self.dirty_strikes:
+            pairs = adjacent_pairs(sorted_strikes, self.dirty_strikes)
+        else:
+            return
+        self.dirty_strikes = set()
         
-        for i in range(len(sorted_strikes) - 1):
-            strike1 = sorted_strikes[i]
-            strike2 = sorted_strikes[i + 1]
-            
-            # CALL arbitrage
-            call1_ask = strikes[strike1]['call'].get('ask', 0)
-            call2_bid = strikes[strike2]['call'].get('bid', 0)
-            call1_symbol = strikes[strike1]['call'].get('symbol', '')
-            
-            if call1_ask > 0 and call2_bid > 0 and call1_symbol:
-                # Check ask quantity > 5 lots
-                ask_quantity = self.get_ask_quantity(call1_symbol)
-                
-                call_diff = call1_ask - call2_bid
-                if call_diff < 0 and abs(call_diff) >= DELTA_THRESHOLD["ETH"] and ask_quantity > 5:
-                    alert_key = f"ETH_CALL_{strike1}_{strike2}_{self.active_expiry}"
-                    if self.can_alert(alert_key):
-                        profit = abs(call_diff)
-                        expiry_display = format_expiry_display(self.active_expiry)
-                        current_time = get_ist_time()
-                        
-                        alert_msg = f"🔵 ETH Alert Call\n{strike1} (B) → {strike2} (S)\n${call1_ask:.2f}    ${call2_bid:.2f}\nProfit: ${profit:.2f}\nQuantity: {ask_quantity} lots\n{expiry_display} | {current_time}"
-                        alerts.append(alert_msg)
-            
-            # PUT arbitrage
-            put2_ask = strikes[strike2]['put'].get('ask', 0)
-            put1_bid = strikes[strike1]['put'].get('bid', 0)
-            put2_symbol = strikes[strike2]['put'].get('symbol', '')
+        alerts = []
+        threshold = DELTA_THRESHOLD["ETH"]
+        expiry_display = format_expiry_display(self.active_expiry)
+        current_time = get_ist_time()
+        tick_ts = time_module.monotonic_ns()
+        
+        for side, strike1, strike2, buy, sell in find_arbitrage_pairs(pairs, strikes, threshold):
+            # Check ask quantity > 5 lots (orderbook is only read for pairs that pass the price check)
+            ask_quantity = self.get_ask_quantity(buy.symbol)
+            if ask_quantity <= 5:
+                continue
             
-            if put1_bid > 0 and put2_ask > 0 and put2_symbol:
-                # Check ask quantity > 5 lots
-                ask_quantity = self.get_ask_quantity(put2_symbol)
-                
-                put_diff = put2_ask - put1_bid
-                if put_diff < 0 and abs(put_diff) >= DELTA_THRESHOLD["ETH"] and ask_quantity > 5:
-                    alert_key = f"ETH_PUT_{strike1}_{strike2}_{self.active_expiry}"
-                    if self.can_alert(alert_key):
-                        profit = abs(put_diff)
-                        expiry_display = format_expiry_display(self.active_expiry)
-                        current_time = get_ist_time()
-                        
-                        alert_msg = f"🔵 ETH Alert Put\n{strike2} (B) → {strike1} (S)\n${put2_ask:.2f}    ${put1_bid:.2f}\nProfit: ${profit:.2f}\nQuantity: {ask_quantity} lots\n{expiry_display} | {current_time}"
-                        alerts.append(alert_msg)
+            profit = sell.bid - buy.ask
+            if side == 'call':
+                alert_key = ('call', strike1, strike2)
+                if self.can_alert(alert_key, tick_ts):
+                    alerts.append(ARBITRAGE_ALERT_TEMPLATE.format(
+                        icon="🔵", asset="ETH", side="Call",
+                        buy_strike=strike1, sell_strike=strike2,
+                        buy_price=buy.ask, sell_price=sell.bid, profit=profit,
+                        quantity=ask_quantity, expiry=expiry_display, time=current_time
+                    ))
+            else:
+                alert_key = ('put', strike1, strike2)
+                if self.can_alert(alert_key, tick_ts):
+                    alerts.append(ARBITRAGE_ALERT_TEMPLATE.format(
+                        icon="🔵", asset="ETH", side="Put",
+                        buy_strike=strike2, sell_strike=strike1,
+                        buy_price=buy.ask, sell_price=sell.bid, profit=profit,
+                        quantity=ask_quantity, expiry=expiry_display, time=current_time
+                    ))
         
         if alerts:
-            for alert in alerts:
-                send_telegram(alert)
-                self.alert_count += 1
-                print(f"[{datetime.now()}] ✅ ETH: Sent arbitrage alert (with quantity check)")
+            send_telegram_alerts(alerts)
+            self.alert_count += len(alerts)
+            log.info(f"✅ ETH: Sent {len(alerts)} arbitrage alert(s) (with quantity check)")
 
     def subscribe_to_options(self):
         """Subscribe to ACTIVE ETH expiry options"""
         symbols = self.get_all_options_symbols()
         
         if not symbols:
-            print(f"[{datetime.now()}] ⚠️ ETH: No {self.active_expiry} expiry options symbols found")
+            log.warning(f"⚠️ ETH: No {self.active_expiry} expiry options symbols found")
+            self.ready.clear()
             return
         
-        self.active_symbols = symbols
+        with self.book_lock:
+            self.active_symbols = symbols
+            self.subscribed_symbols = frozenset(symbols)
+            
+            # Parse the subscribed set up front so the first tick per symbol is a plain lookup
+            for symbol in symbols:
+                self.cache_symbol_meta(symbol)
         
         if symbols:
-            # Subscribe to both L1 and L2 orderbooks for quantity data
-            payload = {
-                "type": "subscribe",
-                "payload": {
-                    "channels": [
-                        {
-                            "name": "l1_orderbook",
-                            "symbols": symbols
-                        },
-                        {
-                            "name": "order_book",  # For quantity data
-                            "symbols": symbols
-                        }
-                    ]
+            # Symbols only change on expiry switches, so reconnects resend the same message
+            if self.subscribe_payload is None or self.subscribe_payload[0] != symbols:
+                # Subscribe to both L1 and L2 orderbooks for quantity data
+                payload = {
+                    "type": "subscribe",
+                    "payload": {
+                        "channels": [
+                            {
+                                "name": "l1_orderbook",
+                                "symbols": symbols
+                            },
+                            {
+                                "name": "order_book",  # For quantity data
+                                "symbols": symbols
+                            }
+                        ]
+                    }
                 }
-            }
+                self.subscribe_payload = (symbols, json_dumps(payload))
             
-            self.ws.send(json.dumps(payload))
-            print(f"[{datetime.now()}] 📡 ETH: Subscribed to {len(symbols)} {self.active_expiry} expiry symbols (L1 + L2)")
+            self.ws.send(self.subscribe_payload[1])
+            self.ready.set()
+            log.info(f"📡 ETH: Subscribed to {len(symbols)} {self.active_expiry} expiry symbols (L1 + L2)")
             
             current_time_str = get_ist_time()
             send_telegram(f"🔗 ETH Bot Connected\n\n📅 Monitoring: {self.active_expiry}\n📊 Symbols: {len(symbols)}\n⏰ Time: {current_time_str}\n\nETH Bot is now live! 🚀")
 
-    def can_alert(self, alert_key):
-        """Check if we can send alert (cooldown)"""
-        now = datetime.now().timestamp()
-        last_time = self.last_alert_time.get(alert_key, 0)
-        if now - last_time >= ALERT_COOLDOWN:
+    def can_alert(self, alert_key, now=None):
+        """Check if we can send alert (cooldown); now is the caller's monotonic_ns tick timestamp"""
+        if now is None:
+            now = time_module.monotonic_ns()
+        last_time = self.last_alert_time.get(alert_key)
+        if last_time is None or now - last_time >= ALERT_COOLDOWN_NS:
             self.last_alert_time[alert_key] = now
+            self.last_alert_time.move_to_end(alert_key)
+            self.prune_alert_times(now)
             return True
         return False
 
+    def prune_alert_times(self, now):
+        """Forget alert keys whose cooldown has passed, and cap how many are kept"""
+        last_alert_time = self.last_alert_time
+        while last_alert_time:
+            oldest_key, oldest_time = next(iter(last_alert_time.items()))
+            if now - oldest_time < ALERT_COOLDOWN_NS and len(last_alert_time) <= ALERT_KEY_LIMIT:
+                break
+            del last_alert_time[oldest_key]
+
     def connect(self):
         """Connect to WebSocket"""
-        print(f"[{datetime.now()}] 🌐 ETH: Connecting to WebSocket...")
+        log.info("🌐 ETH: Connecting to WebSocket...")
         self.ws = websocket.WebSocketApp(
             self.websocket_url,
             on_open=self.on_open,
@@ -1004,7 +1386,18 @@ class ETHWebSocketBot:
             on_error=self.on_error,
             on_close=self.on_close
         )
-        self.ws.run_forever()
+        self.ws.run_forever(
+            ping_interval=WS_PING_INTERVAL,
+            ping_timeout=WS_PING_TIMEOUT,
+            sockopt=WS_SOCKOPT,
+            skip_utf8_validation=True
+        )
+
+    def reconnect_delay(self):
+        """Next reconnect delay: 1, 2, 4 ... capped at WS_RECONNECT_MAX_DELAY, plus jitter"""
+        delay = min(WS_RECONNECT_MAX_DELAY, 2 ** min(self.reconnect_attempt, 6))
+        self.reconnect_attempt += 1
+        return delay + random.uniform(0, 1)
 
     def start(self):
         """Start the bot in a separate thread"""
@@ -1013,33 +1406,83 @@ class ETHWebSocketBot:
                 try:
                     self.connect()
                 except Exception as e:
-                    print(f"[{datetime.now()}] ❌ ETH: Connection error: {e}")
-                    sleep(10)
+                    log.error(f"❌ ETH: Connection error: {e}")
+                
+                if self.should_reconnect:
+                    delay = self.reconnect_delay()
+                    log.info(f"🔄 ETH: Reconnecting in {delay:.1f} seconds...")
+                    sleep(delay)
         
         bot_thread = threading.Thread(target=run_bot)
         bot_thread.daemon = True
         bot_thread.start()
-        print(f"[{datetime.now()}] ✅ ETH: Bot thread started")
+        
+        # Expiry rollover checks make REST calls, so keep them off the WebSocket thread
+        threading.Thread(target=self.expiry_watcher, daemon=True).start()
+        log.info("✅ ETH: Bot thread started")
+
+    def expiry_watcher(self):
+        """Check expiry rollover every EXPIRY_CHECK_INTERVAL seconds"""
+        while self.should_reconnect:
+            try:
+                self.check_and_update_expiry()
+                self.sweep_stale_quotes()
+            except Exception as e:
+                log.error(f"❌ ETH: Expiry check error: {e}")
+            sleep(EXPIRY_CHECK_INTERVAL)
+
+    def sweep_stale_quotes(self):
+        """Drop stored quotes that don't belong to the active expiry"""
+        with self.book_lock:
+            active_expiry = self.active_expiry
+            stale = []
+            for symbol in self.options_prices:
+                meta = parse_symbol(symbol)
+                if meta is None or meta[3] != active_expiry:
+                    stale.append(symbol)
+            if not stale:
+                return
+            
+            for symbol in stale:
+                self.options_prices.pop(symbol, None)
+                self.orderbook_data.pop(symbol, None)
+            
+            # Rebuild the strike index from what is left
+            self.reset_strike_index()
+            for symbol, quote in self.options_prices.items():
+                self.index_quote(symbol, quote)
+        log.info(f"🧹 ETH: Dropped {len(stale)} stale quotes")
 
 # -------------------------------
 # Combined BTC REST API Bot (Systems 1, 2 & 3)
 # -------------------------------
+# Let Delta filter the ticker list; unfiltered /tickers returns every product on the exchange
+BTC_TICKER_PARAMS = {
+    'contract_types': 'call_options,put_options',
+    'underlying_asset_symbols': 'BTC'
+}
+
 class BTCRESTBot:
     def __init__(self):
         self.base_url = "https://api.india.delta.exchange/v2"
-        self.last_alert_time = {}
+        self.last_alert_time = OrderedDict()  # (kind, strike, strike) -> monotonic_ns time, oldest first
         self.running = True
+        self.monitor_thread = None
+        self.state_lock = threading.Lock()  # Guards running/monitor_thread across start/stop requests
         self.fetch_count = 0
         self.alert_count = 0
         self.current_expiry = get_current_expiry()
         self.active_expiry = self.get_initial_active_expiry()
         self.active_symbols = []
-        self.last_expiry_check = 0
+        self.last_expiry_check = NEVER
         self.expiry_rollover_count = 0
-        self.last_debug_log = 0
+        self.last_debug_log = NEVER
         self.options_prices = {}
-        self.last_arbitrage_check = 0
+        self.strikes = {}  # strike -> {'call': OptionQuote, 'put': OptionQuote}, reused across fetches
+        self.sorted_strikes = []
+        self.last_arbitrage_check = NEVER
         self.last_spike_check = 0
+        self.ready = Readiness()  # Set while ticker fetches succeed; cleared on failure or stop
         
         # System 2 data
         self.option_chain_data = {'calls': {}, 'puts': {}}
@@ -1048,21 +1491,21 @@ class BTCRESTBot:
     def get_initial_active_expiry(self):
         """Determine which expiry should be active right now"""
         now = datetime.now(timezone.utc)
-        ist_now = now + timedelta(hours=5, minutes=30)
+        ist_now = now + IST_OFFSET
         
         if ist_now.hour >= 17 and ist_now.minute >= 30:
             next_day = ist_now + timedelta(days=1)
             next_expiry = next_day.strftime("%d%m%y")
-            print(f"[{datetime.now()}] 🕠 BTC: After 5:30 PM, starting with next expiry: {next_expiry}")
+            log.info(f"🕠 BTC: After 5:30 PM, starting with next expiry: {next_expiry}")
             return next_expiry
         else:
-            print(f"[{datetime.now()}] 📅 BTC: Starting with today's expiry: {self.current_expiry}")
+            log.info(f"📅 BTC: Starting with today's expiry: {self.current_expiry}")
             return self.current_expiry
 
     def should_rollover_expiry(self):
         """Check if we should move to next expiry"""
         now = datetime.now(timezone.utc)
-        ist_now = now + timedelta(hours=5, minutes=30)
+        ist_now = now + IST_OFFSET
         
         if ist_now.hour >= 17 and ist_now.minute >= 30:
             next_expiry = (ist_now + timedelta(days=1)).strftime("%d%m%y")
@@ -1072,74 +1515,57 @@ class BTCRESTBot:
     def get_available_expiries(self):
         """Get all available BTC expiries from the API"""
         try:
-            url = f"{self.base_url}/tickers"
-            params = {
-                'contract_types': 'call_options,put_options',
-                'underlying_asset_symbols': 'BTC'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    tickers = data.get('result', [])
-                    expiries = set()
-                    
-                    for ticker in tickers:
-                        symbol = ticker.get('symbol', '')
-                        if 'BTC' in symbol:
-                            expiry = self.extract_expiry_from_symbol(symbol)
-                            if expiry:
-                                expiries.add(expiry)
-                    
-                    return sorted(expiries)
-            return []
+            return get_live_expiries('BTC')
         except Exception as e:
-            print(f"[{datetime.now()}] ❌ BTC: Error fetching expiries: {e}")
+            log.error(f"❌ BTC: Error fetching expiries: {e}")
             return []
 
-    def get_next_available_expiry(self, current_expiry):
-        """Get the next available expiry after current one"""
-        available_expiries = self.get_available_expiries()
+    def get_next_available_expiry(self, current_expiry, available_expiries=None):
+        """Get the next available expiry after current one (pass available_expiries to skip the fetch)"""
+        if available_expiries is None:
+            available_expiries = self.get_available_expiries()
         if not available_expiries:
             return current_expiry
         
-        print(f"[{datetime.now()}] 📊 BTC: Available expiries: {available_expiries}")
-        
-        for expiry in available_expiries:
-            if expiry > current_expiry:
-                return expiry
+        log.info(f"📊 BTC: Available expiries: {available_expiries}")
         
+        index = bisect.bisect_right(available_expiries, expiry_sort_key(current_expiry), key=expiry_sort_key)
+        if index < len(available_expiries):
+            return available_expiries[index]
         return available_expiries[-1]
 
     def check_and_update_expiry(self):
         """Check if we need to update the active expiry"""
         global price_history, last_spike_alert, last_spread_alert
         
-        current_time = datetime.now().timestamp()
+        current_time = time_module.monotonic()
         if current_time - self.last_expiry_check >= EXPIRY_CHECK_INTERVAL:
             self.last_expiry_check = current_time
             
             current_time_str = get_ist_time()
-            print(f"[{datetime.now()}] 🔄 BTC: Checking expiry rollover... (Current: {self.active_expiry}, Time: {current_time_str})")
+            log.info(f"🔄 BTC: Checking expiry rollover... (Current: {self.active_expiry}, Time: {current_time_str})")
+            
+            # One fetch serves both the rollover and the availability checks
+            available_expiries = self.get_available_expiries()
             
             next_expiry = self.should_rollover_expiry()
             if next_expiry and next_expiry != self.active_expiry:
-                print(f"[{datetime.now()}] 🎯 BTC: EXPIRY ROLLOVER TRIGGERED!")
-                print(f"[{datetime.now()}] 📅 BTC: Changing from {self.active_expiry} to {next_expiry}")
+                log.info("🎯 BTC: EXPIRY ROLLOVER TRIGGERED!")
+                log.info(f"📅 BTC: Changing from {self.active_expiry} to {next_expiry}")
                 
-                actual_next_expiry = self.get_next_available_expiry(self.active_expiry)
+                actual_next_expiry = self.get_next_available_expiry(self.active_expiry, available_expiries)
                 
                 if actual_next_expiry != self.active_expiry:
                     self.active_expiry = actual_next_expiry
                     self.expiry_rollover_count += 1
+                    invalidate_api_cache()
                     
                     # Clear all systems' data
                     self.options_prices = {}
                     self.active_symbols = []
                     self.option_chain_data = {'calls': {}, 'puts': {}}
                     self.orderbook_data = {}
+                    self.last_alert_time = OrderedDict()  # cooldowns were for the old expiry's contracts
                     
                     # Update alert configs with new expiry
                     for config_id in alert_configs:
@@ -1147,33 +1573,27 @@ class BTCRESTBot:
                             alert_configs[config_id].active_expiry = self.active_expiry
                     
                     # Clear price history and alert timestamps for old expiry symbols
-                    old_symbols = [s for s in price_history.keys() if 'BTC' in s]
-                    for symbol in old_symbols:
-                        if symbol in price_history:
-                            del price_history[symbol]
-                        if symbol in last_spike_alert:
-                            del last_spike_alert[symbol]
-                        if symbol in last_spread_alert:
-                            del last_spread_alert[symbol]
+                    clear_spike_history("BTC")
                     
                     send_telegram(f"🔄 BTC Expiry Rollover Complete!\n\n📅 Now monitoring: {self.active_expiry}\n⏰ Time: {current_time_str}")
                     return True
                 else:
-                    print(f"[{datetime.now()}] ⚠️ BTC: No new expiry available yet, keeping: {self.active_expiry}")
+                    log.warning(f"⚠️ BTC: No new expiry available yet, keeping: {self.active_expiry}")
             
-            available_expiries = self.get_available_expiries()
             if available_expiries and self.active_expiry not in available_expiries:
-                print(f"[{datetime.now()}] ⚠️ BTC: Current expiry {self.active_expiry} no longer available!")
-                next_available = self.get_next_available_expiry(self.active_expiry)
+                log.warning(f"⚠️ BTC: Current expiry {self.active_expiry} no longer available!")
+                next_available = self.get_next_available_expiry(self.active_expiry, available_expiries)
                 if next_available != self.active_expiry:
-                    print(f"[{datetime.now()}] 🔄 BTC: Switching to available expiry: {next_available}")
+                    log.info(f"🔄 BTC: Switching to available expiry: {next_available}")
                     self.active_expiry = next_available
                     self.expiry_rollover_count += 1
+                    invalidate_api_cache()
                     
                     self.options_prices = {}
                     self.active_symbols = []
                     self.option_chain_data = {'calls': {}, 'puts': {}}
                     self.orderbook_data = {}
+                    self.last_alert_time = OrderedDict()  # cooldowns were for the old expiry's contracts
                     
                     # Update alert configs
                     for config_id in alert_configs:
@@ -1181,46 +1601,18 @@ class BTCRESTBot:
                             alert_configs[config_id].active_expiry = self.active_expiry
                     
                     # Clear price history and alert timestamps for old expiry symbols
-                    old_symbols = [s for s in price_history.keys() if 'BTC' in s]
-                    for symbol in old_symbols:
-                        if symbol in price_history:
-                            del price_history[symbol]
-                        if symbol in last_spike_alert:
-                            del last_spike_alert[symbol]
-                        if symbol in last_spread_alert:
-                            del last_spread_alert[symbol]
+                    clear_spike_history("BTC")
                     
                     send_telegram(f"🔄 BTC Expiry Update!\n\n📅 Now monitoring: {self.active_expiry}\n⏰ Time: {current_time_str}")
                     return True
         
         return False
 
-    def extract_expiry_from_symbol(self, symbol):
-        """Extract expiry date from symbol string"""
-        try:
-            parts = symbol.split('-')
-            if len(parts) >= 4:
-                return parts[3]
-            return None
-        except:
-            return None
-
-    def extract_strike(self, symbol):
-        """Extract strike price from symbol"""
-        try:
-            parts = symbol.split('-')
-            for part in parts:
-                if part.isdigit() and len(part) > 2:
-                    return int(part)
-            return 0
-        except:
-            return 0
-
     def debug_log(self, message, force=False):
         """Debug logging with rate limiting"""
-        current_time = datetime.now().timestamp()
+        current_time = time_module.monotonic()
         if force or current_time - self.last_debug_log >= 10:
-            print(f"[{datetime.now()}] {message}")
+            log.info(message)
             self.last_debug_log = current_time
 
     def fetch_tickers(self):
@@ -1228,12 +1620,11 @@ class BTCRESTBot:
         try:
             self.debug_log("🔄 BTC: Fetching tickers from API...")
             url = f"{self.base_url}/tickers"
-            response = requests.get(url, timeout=10)
+            # Not cached: every poll needs fresh quotes
+            response = delta_session.get(url, params=BTC_TICKER_PARAMS, timeout=DELTA_TIMEOUT)
+            data = json_loads(response.content) if response.status_code == 200 else None
             
-            self.debug_log(f"📡 BTC: API Response Status: {response.status_code}")
-            
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 if data.get('success'):
                     tickers = data.get('result', [])
                     self.debug_log(f"✅ BTC: Got {len(tickers)} tickers")
@@ -1241,7 +1632,7 @@ class BTCRESTBot:
                 else:
                     self.debug_log(f"❌ BTC: API success=False: {data}")
             else:
-                self.debug_log(f"❌ BTC: HTTP Error: {response.status_code} - {response.text}")
+                self.debug_log("❌ BTC: HTTP Error fetching tickers")
                 
         except Exception as e:
             self.debug_log(f"❌ BTC: Exception fetching tickers: {e}")
@@ -1253,10 +1644,10 @@ class BTCRESTBot:
         try:
             url = f"{self.base_url}/orderbook"
             params = {'symbol': symbol}
-            response = requests.get(url, params=params, timeout=5)
+            response = delta_session.get(url, params=params, timeout=DELTA_ORDERBOOK_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 if data.get('success'):
                     return data.get('result', {})
         except Exception as e:
@@ -1290,32 +1681,32 @@ class BTCRESTBot:
         tickers = self.fetch_tickers()
         if not tickers:
             self.debug_log("❌ BTC: No tickers received")
+            self.ready.clear()
             return {}
-
-        btc_tickers = [t for t in tickers if 'BTC' in str(t.get('symbol', '')).upper()]
-        self.debug_log(f"🔍 BTC: Found {len(btc_tickers)} BTC tickers")
         
+        self.ready.set()
+
         current_expiry_tickers = []
+        active_expiry = self.active_expiry
         
         # Clear option chain data
         self.option_chain_data = {'calls': {}, 'puts': {}}
         
-        for ticker in btc_tickers:
+        # Single pass over the payload: parse_symbol is memoised, so matching
+        # asset and expiry costs one cache lookup per ticker
+        for ticker in tickers:
             symbol = ticker.get('symbol', '')
-            parts = symbol.split('-')
-            if len(parts) >= 4:
-                expiry = parts[-1]
-                if expiry == self.active_expiry:
-                    current_expiry_tickers.append(ticker)
-                    
-                    # Store for System 2 dropdowns
-                    strike = self.extract_strike(symbol)
-                    if strike > 0:
-                        # Check if it's a call or put based on symbol prefix
-                        if symbol.startswith('C-'):
-                            self.option_chain_data['calls'][strike] = symbol
-                        elif symbol.startswith('P-'):
-                            self.option_chain_data['puts'][strike] = symbol
+            meta = parse_symbol(symbol)
+            if meta and meta[1] == 'BTC' and meta[3] == active_expiry:
+                current_expiry_tickers.append(ticker)
+                
+                # Store for System 2 dropdowns
+                side, _, strike, _ = meta
+                if strike > 0:
+                    if side == 'C':
+                        self.option_chain_data['calls'][strike] = symbol
+                    else:
+                        self.option_chain_data['puts'][strike] = symbol
         
         # Sort strikes
         self.option_chain_data['calls'] = dict(sorted(self.option_chain_data['calls'].items()))
@@ -1325,60 +1716,48 @@ class BTCRESTBot:
         self.debug_log(f"📅 BTC: Found {len(current_expiry_tickers)} tickers for expiry {self.active_expiry}")
         
         # Store prices for ALL systems
+        current_quotes = []
         for ticker in current_expiry_tickers:
             symbol = ticker.get('symbol', '')
             quotes = ticker.get('quotes', {})
-            bid = float(quotes.get('best_bid', 0)) or 0
-            ask = float(quotes.get('best_ask', 0)) or 0
+            bid = to_price(quotes.get('best_bid'))
+            ask = to_price(quotes.get('best_ask'))
             
-            self.options_prices[symbol] = {
-                'bid': bid,
-                'ask': ask,
-                'symbol': symbol
-            }
+            quote = OptionQuote(bid, ask, symbol)
+            self.options_prices[symbol] = quote
+            current_quotes.append(quote)
         
-        return self.group_by_strike(current_expiry_tickers)
+        return self.group_by_strike(current_quotes)
 
-    def group_by_strike(self, tickers):
-        """Group tickers by strike price for System 1"""
-        grouped = {}
+    def group_by_strike(self, quotes):
+        """Group already-parsed quotes by strike price for System 1
         
-        for ticker in tickers:
-            symbol = ticker.get('symbol', '')
-            parts = symbol.split('-')
-            
-            # Extract strike
-            strike = 0
-            for part in parts:
-                if part.isdigit() and len(part) > 2:
-                    strike = int(part)
-                    break
-            
+        The strike dict and its sorted key list persist between fetches: known
+        strikes are updated in place and only strikes missing from this fetch
+        are dropped.
+        """
+        grouped = self.strikes
+        seen = set()
+        
+        for quote in quotes:
+            side, _, strike, _ = parse_symbol(quote.symbol)
             if strike == 0:
                 continue
-                
-            # Detect option type
-            option_type = 'call' if parts[0].startswith('C') else 'put' if parts[0].startswith('P') else 'unknown'
             
-            if option_type == 'unknown':
-                continue
-                
-            # Get prices
-            quotes = ticker.get('quotes', {})
-            bid = float(quotes.get('best_bid', 0)) or 0
-            ask = float(quotes.get('best_ask', 0)) or 0
-            
-            if strike not in grouped:
-                grouped[strike] = {'call': {'bid': 0, 'ask': 0, 'symbol': ''}, 'put': {'bid': 0, 'ask': 0, 'symbol': ''}}
-            
-            if option_type == 'call':
-                grouped[strike]['call']['bid'] = bid
-                grouped[strike]['call']['ask'] = ask
-                grouped[strike]['call']['symbol'] = symbol
-            else:  # put
-                grouped[strike]['put']['bid'] = bid
-                grouped[strike]['put']['ask'] = ask
-                grouped[strike]['put']['symbol'] = symbol
+            legs = grouped.get(strike)
+            if legs is None:
+                legs = grouped[strike] = {'call': EMPTY_QUOTE, 'put': EMPTY_QUOTE}
+                bisect.insort(self.sorted_strikes, strike)
+            if strike not in seen:
+                # First quote for this strike in this fetch; forget last fetch's legs
+                seen.add(strike)
+                legs['call'] = legs['put'] = EMPTY_QUOTE
+            legs['call' if side == 'C' else 'put'] = quote
+        
+        if len(seen) != len(grouped):
+            for strike in grouped.keys() - seen:
+                del grouped[strike]
+            self.sorted_strikes = sorted(grouped)
         
         self.debug_log(f"💰 BTC: Grouped {len(grouped)} strikes with valid prices")
         return grouped
@@ -1388,114 +1767,118 @@ class BTCRESTBot:
         if not new_system_active:
             return
         
+        tick_ts = time_module.monotonic_ns()
+        
         # Check BTC calls
         btc_call_config = alert_configs['btc_call']
         if btc_call_config.is_monitoring and btc_call_config.strike > 0 and btc_call_config.premium > 0:
             alerts = []
+            config_strike = btc_call_config.strike
+            min_premium = btc_call_config.premium
             for strike, symbol in self.option_chain_data['calls'].items():
-                if strike > btc_call_config.strike:
+                if strike > config_strike:
                     price_data = self.options_prices.get(symbol)
-                    if price_data and price_data['bid'] >= btc_call_config.premium:
-                        alert_key = f"BTC_CALL_ALERT_{strike}_{btc_call_config.strike}"
-                        if self.can_alert(alert_key):
+                    if price_data and price_data.bid >= min_premium:
+                        alert_key = ('call_alert', strike, config_strike)
+                        if self.can_alert(alert_key, tick_ts):
                             alerts.append({
                                 'asset': 'BTC',
                                 'type': 'call',
                                 'trigger_strike': strike,
-                                'bid_price': price_data['bid'],
-                                'config_strike': btc_call_config.strike,
-                                'threshold': btc_call_config.premium
+                                'bid_price': price_data.bid,
+                                'config_strike': config_strike,
+                                'threshold': min_premium
                             })
             
             for alert in alerts:
                 send_alert_triggered_telegram(alert)
-                print(f"[{datetime.now()}] 🚨 BTC CALL Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
+                log.info(f"🚨 BTC CALL Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
         
         # Check BTC puts
         btc_put_config = alert_configs['btc_put']
         if btc_put_config.is_monitoring and btc_put_config.strike > 0 and btc_put_config.premium > 0:
             alerts = []
+            config_strike = btc_put_config.strike
+            min_premium = btc_put_config.premium
             for strike, symbol in self.option_chain_data['puts'].items():
-                if strike < btc_put_config.strike:
+                if strike < config_strike:
                     price_data = self.options_prices.get(symbol)
-                    if price_data and price_data['bid'] >= btc_put_config.premium:
-                        alert_key = f"BTC_PUT_ALERT_{strike}_{btc_put_config.strike}"
-                        if self.can_alert(alert_key):
+                    if price_data and price_data.bid >= min_premium:
+                        alert_key = ('put_alert', strike, config_strike)
+                        if self.can_alert(alert_key, tick_ts):
                             alerts.append({
                                 'asset': 'BTC',
                                 'type': 'put',
                                 'trigger_strike': strike,
-                                'bid_price': price_data['bid'],
-                                'config_strike': btc_put_config.strike,
-                                'threshold': btc_put_config.premium
+                                'bid_price': price_data.bid,
+                                'config_strike': config_strike,
+                                'threshold': min_premium
                             })
             
             for alert in alerts:
                 send_alert_triggered_telegram(alert)
-                print(f"[{datetime.now()}] 🚨 BTC PUT Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
+                log.info(f"🚨 BTC PUT Alert: Strike {alert['trigger_strike']} bid ${alert['bid_price']:.2f} ≥ ${alert['threshold']:.2f}")
 
     def check_arbitrage(self, grouped_data):
         """SYSTEM 1: Check for arbitrage opportunities with quantity check"""
         if not grouped_data:
             return []
             
-        strikes = sorted(grouped_data.keys())
+        strikes = self.sorted_strikes
         alerts = []
-        
-        for i in range(len(strikes) - 1):
-            strike1 = strikes[i]
-            strike2 = strikes[i + 1]
-            
-            # CALL arbitrage
-            call1_ask = grouped_data[strike1]['call']['ask']
-            call2_bid = grouped_data[strike2]['call']['bid']
-            call1_symbol = grouped_data[strike1]['call']['symbol']
-            
-            if call1_ask > 0 and call2_bid > 0 and call1_symbol:
-                # Check ask quantity > 5 lots
-                ask_quantity = self.get_ask_quantity(call1_symbol)
-                
-                call_diff = call1_ask - call2_bid
-                if call_diff < 0 and abs(call_diff) >= DELTA_THRESHOLD["BTC"] and ask_quantity > 5:
-                    alert_key = f"BTC_CALL_{strike1}_{strike2}"
-                    if self.can_alert(alert_key):
-                        profit = abs(call_diff)
-                        expiry_display = format_expiry_display(self.active_expiry)
-                        current_time = get_ist_time()
-                        
-                        alert_msg = f"🔔 BTC Alert Call\n{strike1} (B) → {strike2} (S)\n${call1_ask:.2f}    ${call2_bid:.2f}\nProfit: ${profit:.2f}\nQuantity: {ask_quantity} lots\n{expiry_display} | {current_time}"
-                        alerts.append(alert_msg)
-            
-            # PUT arbitrage
-            put2_ask = grouped_data[strike2]['put']['ask']
-            put1_bid = grouped_data[strike1]['put']['bid']
-            put2_symbol = grouped_data[strike2]['put']['symbol']
+        threshold = DELTA_THRESHOLD["BTC"]
+        expiry_display = format_expiry_display(self.active_expiry)
+        current_time = get_ist_time()
+        tick_ts = time_module.monotonic_ns()
+        
+        for side, strike1, strike2, buy, sell in find_arbitrage_pairs(adjacent_pairs(strikes), grouped_data, threshold):
+            # Check ask quantity > 5 lots (orderbook is only fetched for pairs that pass the price check)
+            ask_quantity = self.get_ask_quantity(buy.symbol)
+            if ask_quantity <= 5:
+                continue
             
-            if put1_bid > 0 and put2_ask > 0 and put2_symbol:
-                # Check ask quantity > 5 lots
-                ask_quantity = self.get_ask_quantity(put2_symbol)
-                
-                put_diff = put2_ask - put1_bid
-                if put_diff < 0 and abs(put_diff) >= DELTA_THRESHOLD["BTC"] and ask_quantity > 5:
-                    alert_key = f"BTC_PUT_{strike1}_{strike2}"
-                    if self.can_alert(alert_key):
-                        profit = abs(put_diff)
-                        expiry_display = format_expiry_display(self.active_expiry)
-                        current_time = get_ist_time()
-                        
-                        alert_msg = f"🔔 BTC Alert Put\n{strike2} (B) → {strike1} (S)\n${put2_ask:.2f}    ${put1_bid:.2f}\nProfit: ${profit:.2f}\nQuantity: {ask_quantity} lots\n{expiry_display} | {current_time}"
-                        alerts.append(alert_msg)
+            profit = sell.bid - buy.ask
+            if side == 'call':
+                alert_key = ('call', strike1, strike2)
+                if self.can_alert(alert_key, tick_ts):
+                    alerts.append(ARBITRAGE_ALERT_TEMPLATE.format(
+                        icon="🔔", asset="BTC", side="Call",
+                        buy_strike=strike1, sell_strike=strike2,
+                        buy_price=buy.ask, sell_price=sell.bid, profit=profit,
+                        quantity=ask_quantity, expiry=expiry_display, time=current_time
+                    ))
+            else:
+                alert_key = ('put', strike1, strike2)
+                if self.can_alert(alert_key, tick_ts):
+                    alerts.append(ARBITRAGE_ALERT_TEMPLATE.format(
+                        icon="🔔", asset="BTC", side="Put",
+                        buy_strike=strike2, sell_strike=strike1,
+                        buy_price=buy.ask, sell_price=sell.bid, profit=profit,
+                        quantity=ask_quantity, expiry=expiry_display, time=current_time
+                    ))
         
         return alerts
 
-    def can_alert(self, alert_key):
-        now = datetime.now().timestamp()
-        last_time = self.last_alert_time.get(alert_key, 0)
-        if now - last_time >= ALERT_COOLDOWN:
+    def can_alert(self, alert_key, now=None):
+        if now is None:
+            now = time_module.monotonic_ns()
+        last_time = self.last_alert_time.get(alert_key)
+        if last_time is None or now - last_time >= ALERT_COOLDOWN_NS:
             self.last_alert_time[alert_key] = now
+            self.last_alert_time.move_to_end(alert_key)
+            self.prune_alert_times(now)
             return True
         return False
 
+    def prune_alert_times(self, now):
+        """Forget alert keys whose cooldown has passed, and cap how many are kept"""
+        last_alert_time = self.last_alert_time
+        while last_alert_time:
+            oldest_key, oldest_time = next(iter(last_alert_time.items()))
+            if now - oldest_time < ALERT_COOLDOWN_NS and len(last_alert_time) <= ALERT_KEY_LIMIT:
+                break
+            del last_alert_time[oldest_key]
+
     def start_monitoring(self):
         self.debug_log("🤖 BTC: Starting Options Monitoring", force=True)
         
@@ -1503,7 +1886,12 @@ class BTCRESTBot:
         current_time_str = get_ist_time()
         send_telegram(f"🔗 BTC Bot Connected\n\n📅 Monitoring: {self.active_expiry}\n📊 Symbols: {len(self.active_symbols)}\n⏰ Time: {current_time_str}\n\nBTC Bot is now live! 🚀")
         
-        while self.running:
+        # Fetches are paced against a monotonic deadline so processing time
+        # doesn't stretch the cadence
+        next_fetch = time_module.monotonic()
+        
+        # A restarted bot gets a new thread; any older loop exits on its next iteration
+        while self.running and threading.current_thread() is self.monitor_thread:
             try:
                 self.fetch_count += 1
                 
@@ -1513,23 +1901,22 @@ class BTCRESTBot:
                 # Process data for ALL systems
                 grouped_data = self.process_btc_options()
                 
-                current_time = datetime.now().timestamp()
+                current_time = time_module.monotonic()
                 
                 # Check ALL systems
                 if current_time - self.last_arbitrage_check >= PROCESS_INTERVAL:
                     # SYSTEM 1: Original arbitrage logic with quantity check
                     alerts = self.check_arbitrage(grouped_data)
                     if alerts:
-                        for alert in alerts:
-                            send_telegram(alert)
-                            self.alert_count += 1
-                            self.debug_log(f"✅ BTC: Sent arbitrage alert (with quantity check)")
+                        send_telegram_alerts(alerts)
+                        self.alert_count += len(alerts)
+                        self.debug_log(f"✅ BTC: Sent {len(alerts)} arbitrage alert(s) (with quantity check)")
                     
                     # SYSTEM 2: User alert logic
                     self.check_user_alerts()
                     
                     # SYSTEM 3: Dual condition detection
-                    check_premium_spikes_btc(self)
+                    check_premium_spikes(self.options_prices)
                     
                     self.last_arbitrage_check = current_time
                     global last_check_time
@@ -1539,14 +1926,34 @@ class BTCRESTBot:
                 if self.fetch_count % 30 == 0:
                     self.debug_log(f"📊 BTC: Stats: Fetches={self.fetch_count}, Alerts={self.alert_count}, Strikes={len(grouped_data)}, Symbols={len(self.active_symbols)}")
                 
-                sleep(BTC_FETCH_INTERVAL)
+                next_fetch += BTC_FETCH_INTERVAL
+                remaining = next_fetch - time_module.monotonic()
+                if remaining > 0:
+                    sleep(remaining)
+                else:
+                    # Overran the interval; start the next cycle now rather than bursting to catch up
+                    next_fetch = time_module.monotonic()
                 
             except Exception as e:
                 self.debug_log(f"❌ BTC: Main loop error: {e}")
                 sleep(1)
+                next_fetch = time_module.monotonic()
+
+    def start(self):
+        """Start the monitoring thread; returns False if it is already running"""
+        with self.state_lock:
+            if self.running and self.monitor_thread is not None and self.monitor_thread.is_alive():
+                return False
+            self.running = True
+            self.ready.restart()
+            self.monitor_thread = threading.Thread(target=self.start_monitoring, daemon=True)
+            self.monitor_thread.start()
+            return True
 
     def stop(self):
-        self.running = False
+        with self.state_lock:
+            self.running = False
+            self.ready.clear()
 
 # -------------------------------
 # Initialize Bots
@@ -2198,17 +2605,17 @@ HTML_TEMPLATE = '''
                             <select name="btc_call_strike" class="select-input">
                                 <option value="">Select Strike</option>
                                 {% for strike in btc_bot.option_chain_data.calls.keys()|sort %}
-                                <option value="{{ strike }}" {% if alert_configs['btc_call'].strike == strike %}selected{% endif %}>
+                                <option value="{{ strike }}" {% if alert_view.btc_call.strike == strike %}selected{% endif %}>
                                     {{ strike }}
                                 </option>
                                 {% endfor %}
                             </select>
                             <input type="number" name="btc_call_premium" placeholder="Premium ($)" 
-                                   value="{{ "%.2f"|format(alert_configs['btc_call'].premium) if alert_configs['btc_call'].premium > 0 else '' }}"
+                                   value="{{ alert_view.btc_call.premium_str }}"
                                    step="0.01" min="0" class="threshold-input">
                             <div class="checkbox-group">
                                 <input type="checkbox" name="btc_call_monitor" id="btc_call_monitor" 
-                                       {% if alert_configs['btc_call'].is_monitoring %}checked{% endif %}>
+                                       {% if alert_view.btc_call.monitoring %}checked{% endif %}>
                                 <label for="btc_call_monitor">Monitor BTC Calls</label>
                             </div>
                             <small style="color: #666;">Found {{ btc_bot.option_chain_data.calls|length }} call strikes</small>
@@ -2220,17 +2627,17 @@ HTML_TEMPLATE = '''
                             <select name="btc_put_strike" class="select-input">
                                 <option value="">Select Strike</option>
                                 {% for strike in btc_bot.option_chain_data.puts.keys()|sort %}
-                                <option value="{{ strike }}" {% if alert_configs['btc_put'].strike == strike %}selected{% endif %}>
+                                <option value="{{ strike }}" {% if alert_view.btc_put.strike == strike %}selected{% endif %}>
                                     {{ strike }}
                                 </option>
                                 {% endfor %}
                             </select>
                             <input type="number" name="btc_put_premium" placeholder="Premium ($)" 
-                                   value="{{ "%.2f"|format(alert_configs['btc_put'].premium) if alert_configs['btc_put'].premium > 0 else '' }}"
+                                   value="{{ alert_view.btc_put.premium_str }}"
                                    step="0.01" min="0" class="threshold-input">
                             <div class="checkbox-group">
                                 <input type="checkbox" name="btc_put_monitor" id="btc_put_monitor"
-                                       {% if alert_configs['btc_put'].is_monitoring %}checked{% endif %}>
+                                       {% if alert_view.btc_put.monitoring %}checked{% endif %}>
                                 <label for="btc_put_monitor">Monitor BTC Puts</label>
                             </div>
                             <small style="color: #666;">Found {{ btc_bot.option_chain_data.puts|length }} put strikes</small>
@@ -2242,17 +2649,17 @@ HTML_TEMPLATE = '''
                             <select name="eth_call_strike" class="select-input">
                                 <option value="">Select Strike</option>
                                 {% for strike in eth_bot.option_chain_data.calls.keys()|sort %}
-                                <option value="{{ strike }}" {% if alert_configs['eth_call'].strike == strike %}selected{% endif %}>
+                                <option value="{{ strike }}" {% if alert_view.eth_call.strike == strike %}selected{% endif %}>
                                     {{ strike }}
                                 </option>
                                 {% endfor %}
                             </select>
                             <input type="number" name="eth_call_premium" placeholder="Premium ($)" 
-                                   value="{{ "%.2f"|format(alert_configs['eth_call'].premium) if alert_configs['eth_call'].premium > 0 else '' }}"
+                                   value="{{ alert_view.eth_call.premium_str }}"
                                    step="0.01" min="0" class="threshold-input">
                             <div class="checkbox-group">
                                 <input type="checkbox" name="eth_call_monitor" id="eth_call_monitor"
-                                       {% if alert_configs['eth_call'].is_monitoring %}checked{% endif %}>
+                                       {% if alert_view.eth_call.monitoring %}checked{% endif %}>
                                 <label for="eth_call_monitor">Monitor ETH Calls</label>
                             </div>
                             <small style="color: #666;">Found {{ eth_bot.option_chain_data.calls|length }} call strikes</small>
@@ -2264,17 +2671,17 @@ HTML_TEMPLATE = '''
                             <select name="eth_put_strike" class="select-input">
                                 <option value="">Select Strike</option>
                                 {% for strike in eth_bot.option_chain_data.puts.keys()|sort %}
-                                <option value="{{ strike }}" {% if alert_configs['eth_put'].strike == strike %}selected{% endif %}>
+                                <option value="{{ strike }}" {% if alert_view.eth_put.strike == strike %}selected{% endif %}>
                                     {{ strike }}
                                 </option>
                                 {% endfor %}
                             </select>
                             <input type="number" name="eth_put_premium" placeholder="Premium ($)" 
-                                   value="{{ "%.2f"|format(alert_configs['eth_put'].premium) if alert_configs['eth_put'].premium > 0 else '' }}"
+                                   value="{{ alert_view.eth_put.premium_str }}"
                                    step="0.01" min="0" class="threshold-input">
                             <div class="checkbox-group">
                                 <input type="checkbox" name="eth_put_monitor" id="eth_put_monitor"
-                                       {% if alert_configs['eth_put'].is_monitoring %}checked{% endif %}>
+                                       {% if alert_view.eth_put.monitoring %}checked{% endif %}>
                                 <label for="eth_put_monitor">Monitor ETH Puts</label>
                             </div>
                             <small style="color: #666;">Found {{ eth_bot.option_chain_data.puts|length }} put strikes</small>
@@ -2288,26 +2695,26 @@ HTML_TEMPLATE = '''
                     <h3>📊 Active Alerts Status</h3>
                     <div class="status-item">
                         <span class="status-label">BTC Calls:</span>
-                        <span class="status-value {% if alert_configs['btc_call'].is_monitoring %}status-active{% else %}status-inactive{% endif %}">
-                            {% if alert_configs['btc_call'].is_monitoring %}✅ ACTIVE{% else %}❌ INACTIVE{% endif %}
+                        <span class="status-value {{ alert_view.btc_call.status_class }}">
+                            {{ alert_view.btc_call.status_text }}
                         </span>
                     </div>
                     <div class="status-item">
                         <span class="status-label">BTC Puts:</span>
-                        <span class="status-value {% if alert_configs['btc_put'].is_monitoring %}status-active{% else %}status-inactive{% endif %}">
-                            {% if alert_configs['btc_put'].is_monitoring %}✅ ACTIVE{% else %}❌ INACTIVE{% endif %}
+                        <span class="status-value {{ alert_view.btc_put.status_class }}">
+                            {{ alert_view.btc_put.status_text }}
                         </span>
                     </div>
                     <div class="status-item">
                         <span class="status-label">ETH Calls:</span>
-                        <span class="status-value {% if alert_configs['eth_call'].is_monitoring %}status-active{% else %}status-inactive{% endif %}">
-                            {% if alert_configs['eth_call'].is_monitoring %}✅ ACTIVE{% else %}❌ INACTIVE{% endif %}
+                        <span class="status-value {{ alert_view.eth_call.status_class }}">
+                            {{ alert_view.eth_call.status_text }}
                         </span>
                     </div>
                     <div class="status-item">
                         <span class="status-label">ETH Puts:</span>
-                        <span class="status-value {% if alert_configs['eth_put'].is_monitoring %}status-active{% else %}status-inactive{% endif %}">
-                            {% if alert_configs['eth_put'].is_monitoring %}✅ ACTIVE{% else %}❌ INACTIVE{% endif %}
+                        <span class="status-value {{ alert_view.eth_put.status_class }}">
+                            {{ alert_view.eth_put.status_text }}
                         </span>
                     </div>
                     <div class="status-item">
@@ -2510,16 +2917,37 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# Serve the dashboard from a named template so Jinja looks it up by name
+# instead of hashing the full source on every request
+app.jinja_loader = ChoiceLoader([DictLoader({'home.html': HTML_TEMPLATE}), app.jinja_loader])
+app.jinja_env.auto_reload = False
+
+# Compile the dashboard template at import so the first request doesn't pay for it
+app.jinja_env.get_template('home.html')
+
 # -------------------------------
 # Flask Routes
 # -------------------------------
 @app.route('/')
 def home():
     now = datetime.now()
-    return render_template_string(HTML_TEMPLATE, 
+
+    # Precompute alert config display values once instead of per template lookup
+    alert_view = {
+        config_id: {
+            'monitoring': config.is_monitoring,
+            'status_class': 'status-active' if config.is_monitoring else 'status-inactive',
+            'status_text': '✅ ACTIVE' if config.is_monitoring else '❌ INACTIVE',
+            'strike': config.strike,
+            'premium_str': f"{config.premium:.2f}" if config.premium > 0 else ''
+        }
+        for config_id, config in alert_configs.items()
+    }
+
+    return render_template('home.html',
                                  eth_bot=eth_bot,
                                  btc_bot=btc_bot,
-                                 alert_configs=alert_configs,
+                                 alert_view=alert_view,
                                  spike_config=spike_config,
                                  DELTA_THRESHOLD=DELTA_THRESHOLD,
                                  new_system_active=new_system_active,
@@ -2612,15 +3040,15 @@ def activate_alerts():
         if new_system_active:
             active_count = sum(1 for config in alert_configs.values() if config.is_monitoring)
             send_telegram(f"🚀 OPTION ALERT SYSTEM ACTIVATED!\n\n📊 Active alerts: {active_count}/4\n⏰ Time: {get_ist_time()}\n\nSystem is now monitoring configured alerts!")
-            print(f"[{datetime.now()}] ✅ Option alert system activated with {active_count} alerts")
+            log.info(f"✅ Option alert system activated with {active_count} alerts")
         else:
             send_telegram(f"⏸️ OPTION ALERT SYSTEM DEACTIVATED\n\n⏰ Time: {get_ist_time()}\n\nNo alerts are currently monitored.")
-            print(f"[{datetime.now()}] ⏸️ Option alert system deactivated")
+            log.info("⏸️ Option alert system deactivated")
         
         return redirect('/?success=Alert+system+activated+successfully!')
         
     except Exception as e:
-        print(f"[{datetime.now()}] ❌ Error activating alerts: {e}")
+        log.error(f"❌ Error activating alerts: {e}")
         return redirect('/?success=Error+activating+alerts')
 
 @app.route('/update_eth_threshold', methods=['POST'])
@@ -2638,13 +3066,13 @@ def update_eth_threshold():
         current_time_str = get_ist_time()
         send_telegram(f"⚙️ ETH Arbitrage Threshold Updated\n\n📊 New Value: ${new_threshold:.2f}\n⏰ Time: {current_time_str}\n\nThreshold changed successfully!")
         
-        print(f"[{datetime.now()}] ✅ ETH threshold updated: ${old_threshold:.2f} → ${new_threshold:.2f}")
+        log.info(f"✅ ETH threshold updated: ${old_threshold:.2f} → ${new_threshold:.2f}")
         
         return redirect('/?success=ETH+threshold+updated+successfully!')
     except ValueError:
         return "Invalid threshold value", 400
     except Exception as e:
-        print(f"[{datetime.now()}] ❌ Error updating ETH threshold: {e}")
+        log.error(f"❌ Error updating ETH threshold: {e}")
         return "Error updating threshold", 500
 
 @app.route('/update_btc_threshold', methods=['POST'])
@@ -2662,13 +3090,13 @@ def update_btc_threshold():
         current_time_str = get_ist_time()
         send_telegram(f"⚙️ BTC Arbitrage Threshold Updated\n\n📊 New Value: ${new_threshold:.2f}\n⏰ Time: {current_time_str}\n\nThreshold changed successfully!")
         
-        print(f"[{datetime.now()}] ✅ BTC threshold updated: ${old_threshold:.2f} → ${new_threshold:.2f}")
+        log.info(f"✅ BTC threshold updated: ${old_threshold:.2f} → ${new_threshold:.2f}")
         
         return redirect('/?success=BTC+threshold+updated+successfully!')
     except ValueError:
         return "Invalid threshold value", 400
     except Exception as e:
-        print(f"[{datetime.now()}] ❌ Error updating BTC threshold: {e}")
+        log.error(f"❌ Error updating BTC threshold: {e}")
         return "Error updating threshold", 500
 
 @app.route('/start_spike_detection', methods=['POST'])
@@ -2678,8 +3106,8 @@ def start_spike_detection():
     
     if not spike_config.enabled_spike:
         spike_config.enabled_spike = True
-        send_telegram(f"🚨 PRICE SPIKE DETECTION STARTED!\n\n⚡ Minimum Spike: {spike_config.min_spike_percent}%\n💰 Minimum Premium: ${spike_config.spike_min_premium:.2f}\n⏰ Cooldown: 120 seconds\n⏰ Time: {get_ist_time()}\n\nPrice spike detection is now active!")
-        print(f"[{datetime.now()}] ✅ Price spike detection started")
+        send_telegram(f"🚨 PRICE SPIKE DETECTION STARTED!\n\n⚡ Minimum Spike: {spike_config.min_spike_percent}%\n💰 Minimum Premium: ${spike_config.spike_min_premium:.2f}\n⏰ Cooldown: {SPIKE_COOLDOWN_DISPLAY}\n⏰ Time: {get_ist_time()}\n\nPrice spike detection is now active!")
+        log.info("✅ Price spike detection started")
     
     return redirect('/?success=Spike+detection+started!')
 
@@ -2691,7 +3119,7 @@ def stop_spike_detection():
     if spike_config.enabled_spike:
         spike_config.enabled_spike = False
         send_telegram(f"⏸️ PRICE SPIKE DETECTION STOPPED\n\n⏰ Time: {get_ist_time()}\n\nPrice spike detection paused.")
-        print(f"[{datetime.now()}] ⏸️ Price spike detection stopped")
+        log.info("⏸️ Price spike detection stopped")
     
     return redirect('/?success=Spike+detection+stopped!')
 
@@ -2702,8 +3130,8 @@ def start_spread_detection():
     
     if not spike_config.enabled_spread:
         spike_config.enabled_spread = True
-        send_telegram(f"🚨 BID-ASK SPREAD DETECTION STARTED!\n\n⚡ Minimum Spread: {spike_config.min_spread_percent}%\n💰 Minimum Premium: ${spike_config.spread_min_premium:.2f}\n⏰ Cooldown: 120 seconds\n⏰ Time: {get_ist_time()}\n\nBid-ask spread detection is now active!")
-        print(f"[{datetime.now()}] ✅ Bid-ask spread detection started")
+        send_telegram(f"🚨 BID-ASK SPREAD DETECTION STARTED!\n\n⚡ Minimum Spread: {spike_config.min_spread_percent}%\n💰 Minimum Premium: ${spike_config.spread_min_premium:.2f}\n⏰ Cooldown: {SPIKE_COOLDOWN_DISPLAY}\n⏰ Time: {get_ist_time()}\n\nBid-ask spread detection is now active!")
+        log.info("✅ Bid-ask spread detection started")
     
     return redirect('/?success=Spread+detection+started!')
 
@@ -2715,7 +3143,7 @@ def stop_spread_detection():
     if spike_config.enabled_spread:
         spike_config.enabled_spread = False
         send_telegram(f"⏸️ BID-ASK SPREAD DETECTION STOPPED\n\n⏰ Time: {get_ist_time()}\n\nBid-ask spread detection paused.")
-        print(f"[{datetime.now()}] ⏸️ Bid-ask spread detection stopped")
+        log.info("⏸️ Bid-ask spread detection stopped")
     
     return redirect('/?success=Spread+detection+stopped!')
 
@@ -2744,21 +3172,21 @@ def update_spike_config():
         calls_status = "✅" if spike_config.monitor_calls else "❌"
         puts_status = "✅" if spike_config.monitor_puts else "❌"
         
-        send_telegram(f"⚙️ DUAL CONDITION CONFIG UPDATED\n\n📊 Condition 1 (Price Spike): {spike_config.min_spike_percent}%\n💰 Min Premium: ${spike_config.spike_min_premium:.2f}\n📊 Condition 2 (Bid-Ask Spread): {spike_config.min_spread_percent}%\n💰 Min Premium: ${spike_config.spread_min_premium:.2f}\n⏰ Cooldown: 120 seconds (2 minutes)\n\n📡 Assets:\n{eth_status} ETH | {btc_status} BTC\n{calls_status} Calls | {puts_status} Puts\n\n⏰ Time: {current_time_str}")
+        send_telegram(f"⚙️ DUAL CONDITION CONFIG UPDATED\n\n📊 Condition 1 (Price Spike): {spike_config.min_spike_percent}%\n💰 Min Premium: ${spike_config.spike_min_premium:.2f}\n📊 Condition 2 (Bid-Ask Spread): {spike_config.min_spread_percent}%\n💰 Min Premium: ${spike_config.spread_min_premium:.2f}\n⏰ Cooldown: {SPIKE_COOLDOWN_DISPLAY}\n\n📡 Assets:\n{eth_status} ETH | {btc_status} BTC\n{calls_status} Calls | {puts_status} Puts\n\n⏰ Time: {current_time_str}")
         
-        print(f"[{datetime.now()}] ✅ Dual condition config updated")
+        log.info("✅ Dual condition config updated")
         
         return redirect('/?success=Spike+detector+configuration+updated!')
         
     except Exception as e:
-        print(f"[{datetime.now()}] ❌ Error updating spike config: {e}")
+        log.error(f"❌ Error updating spike config: {e}")
         return redirect('/?success=Error+updating+configuration')
 
 @app.route('/health')
 def health():
     current_time_str = get_ist_time()
     
-    return {
+    payload = {
         "system_1_arbitrage": {
             "eth": {
                 "connected": eth_bot.connected,
@@ -2801,17 +3229,17 @@ def health():
                 "monitor_calls": spike_config.monitor_calls,
                 "monitor_puts": spike_config.monitor_puts
             },
-            "cooldown": "120 seconds (2 minutes)"
+            "cooldown": SPIKE_COOLDOWN_DISPLAY
         },
         "current_time": current_time_str,
         "expiry_display": format_expiry_display(eth_bot.active_expiry)
-    }, 200
+    }
+    # Serialized with orjson when available instead of Flask's stdlib provider
+    return Response(json_dumps(payload), status=200, mimetype='application/json')
 
 @app.route('/start_btc')
 def start_btc():
-    if not btc_bot.running:
-        btc_bot.running = True
-        threading.Thread(target=btc_bot.start_monitoring, daemon=True).start()
+    if btc_bot.start():
         return "BTC Bot started"
     return "BTC Bot already running"
 
@@ -2820,48 +3248,85 @@ def stop_btc():
     btc_bot.stop()
     return "BTC Bot stopped"
 
-@app.route('/ping')
-def ping():
-    return "pong", 200
+# /ping is answered at the WSGI layer so health checks skip Flask routing
+PING_HEADERS = [('Content-Type', 'text/plain; charset=utf-8'), ('Content-Length', '4')]
+PING_BODY = [b'pong']
+PING_NOT_READY_HEADERS = [('Content-Type', 'text/plain; charset=utf-8'), ('Content-Length', '9')]
+PING_NOT_READY_BODY = [b'not ready']
+
+def bots_alive():
+    """False once a bot that should be running has been not-ready past the grace period.
+    A BTC bot stopped via /stop_btc isn't expected to be ready."""
+    if eth_bot.should_reconnect and eth_bot.ready.not_ready_for() > PING_NOT_READY_GRACE:
+        return False
+    if btc_bot.running and btc_bot.ready.not_ready_for() > PING_NOT_READY_GRACE:
+        return False
+    return True
+
+def ping_middleware(wsgi_app):
+    def middleware(environ, start_response):
+        if environ.get('PATH_INFO') == '/ping':
+            if bots_alive():
+                start_response('200 OK', PING_HEADERS)
+                return PING_BODY
+            start_response('503 Service Unavailable', PING_NOT_READY_HEADERS)
+            return PING_NOT_READY_BODY
+        return wsgi_app(environ, start_response)
+    return middleware
+
+app.wsgi_app = ping_middleware(app.wsgi_app)
 
 # -------------------------------
 # Start All Systems
 # -------------------------------
+# Startup banner, formatted once at import and logged as a single record
+STARTUP_BANNER = "\n".join([
+    "="*60,
+    "TRIPLE ALERT SYSTEM",
+    "="*60,
+    "⚡ System 1: Arbitrage Alerts",
+    f"   • ETH Threshold: ${DELTA_THRESHOLD['ETH']:.2f}",
+    f"   • BTC Threshold: ${DELTA_THRESHOLD['BTC']:.2f}",
+    "   • Quantity Check: Ask > 5 lots",
+    "🎯 System 2: Option Strike Alerts",
+    "   • 4 independent sections",
+    "   • Fixed call/put separation",
+    "🚨 System 3: Dual Condition Spike Detection",
+    f"   • Condition 1: Price spike ≥ {spike_config.min_spike_percent}%",
+    f"   • Condition 1 Premium Filter: ≥ ${spike_config.spike_min_premium:.2f}",
+    f"   • Condition 2: Bid-ask spread ≥ {spike_config.min_spread_percent}%",
+    f"   • Condition 2 Premium Filter: ≥ ${spike_config.spread_min_premium:.2f}",
+    f"   • Cooldown: {SPIKE_COOLDOWN_DISPLAY} fixed",
+    f"📅 Current expiry: {get_current_expiry()}",
+    "🔄 Auto-expiry at 5:30 PM IST",
+    "="*60
+])
+
 def start_bots():
-    print("="*60)
-    print("TRIPLE ALERT SYSTEM")
-    print("="*60)
-    print(f"⚡ System 1: Arbitrage Alerts")
-    print(f"   • ETH Threshold: ${DELTA_THRESHOLD['ETH']:.2f}")
-    print(f"   • BTC Threshold: ${DELTA_THRESHOLD['BTC']:.2f}")
-    print(f"   • Quantity Check: Ask > 5 lots")
-    print(f"🎯 System 2: Option Strike Alerts")
-    print(f"   • 4 independent sections")
-    print(f"   • Fixed call/put separation")
-    print(f"🚨 System 3: Dual Condition Spike Detection")
-    print(f"   • Condition 1: Price spike ≥ {spike_config.min_spike_percent}%")
-    print(f"   • Condition 1 Premium Filter: ≥ ${spike_config.spike_min_premium:.2f}")
-    print(f"   • Condition 2: Bid-ask spread ≥ {spike_config.min_spread_percent}%")
-    print(f"   • Condition 2 Premium Filter: ≥ ${spike_config.spread_min_premium:.2f}")
-    print(f"   • Cooldown: 120 seconds (2 minutes) fixed")
-    print(f"📅 Current expiry: {get_current_expiry()}")
-    print(f"🔄 Auto-expiry at 5:30 PM IST")
-    print("="*60)
+    log.info("\n" + STARTUP_BANNER)
+    
+    # Start Telegram sender before anything can queue alerts
+    start_telegram_sender()
     
     # Start ETH WebSocket bot (all systems)
     eth_bot.start()
     
     # Start BTC REST API bot (all systems)
-    btc_thread = threading.Thread(target=btc_bot.start_monitoring, daemon=True)
-    btc_thread.start()
+    btc_bot.start()
     
-    print(f"[{datetime.now()}] ✅ All three systems started")
+    log.info("✅ All three systems started")
+    
+    # Long-lived objects now exist; keep them out of GC scans in the hot loops
+    gc.freeze()
 
 if __name__ == "__main__":
     start_bots()
-    sleep(2)
+    
+    # Wait for both bots to come up instead of a fixed startup delay
+    eth_bot.ready.wait(10)
+    btc_bot.ready.wait(10)
     
     port = int(os.environ.get("PORT", 10000))
-    print(f"[{datetime.now()}] 🌐 Website: http://localhost:{port}")
-    print(f"[{datetime.now()}] 🚀 Starting web server on port {port}")
+    log.info(f"🌐 Website: http://localhost:{port}")
+    log.info(f"🚀 Starting web server on port {port}")
     app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
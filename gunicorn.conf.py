@@ -0,0 +1,18 @@
+import os
+
+# Production entrypoint: gunicorn -c gunicorn.conf.py app:app
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+
+# The bots keep their state in-process, so run a single worker and scale
+# request handling with threads. Extra workers would each start their own
+# bots and send duplicate alerts. The same goes for overlapping instances
+# (e.g. during a deploy), so don't run two side by side.
+workers = 1
+worker_class = "gthread"
+threads = 8
+
+
+def post_worker_init(worker):
+    """Start the bots once the worker has loaded the app"""
+    from app import start_bots
+    start_bots()
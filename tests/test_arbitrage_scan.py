@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+import app
+
+STRIKES = [2400, 2500, 2600, 2700]
+
+
+def tick(bot, strike, side="C"):
+    symbol = f"{side}-ETH-{strike}-170326"
+    bot.index_quote(symbol, app.OptionQuote(bid=10.0, ask=11.0, symbol=symbol))
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    """Pair lists handed to find_arbitrage_pairs, one per scan that got that far"""
+    scans = []
+
+    def record(pairs, strikes, threshold):
+        scans.append(list(pairs))
+        return iter(())
+
+    monkeypatch.setattr(app, "find_arbitrage_pairs", record)
+    return scans
+
+
+@pytest.fixture
+def bot(scanned):
+    bot = app.ETHWebSocketBot()
+    bot.active_expiry = "170326"
+    for strike in STRIKES:
+        tick(bot, strike)
+    # The first scan is a full pass; clear it so each test starts between full passes
+    bot.check_arbitrage_same_expiry()
+    scanned.clear()
+    return bot
+
+
+def test_full_pairs():
+    assert list(app.adjacent_pairs(STRIKES)) == [(2400, 2500), (2500, 2600), (2600, 2700)]
+
+
+@pytest.mark.parametrize("changed, expected", [
+    ({2400}, [(2400, 2500)]),
+    ({2700}, [(2600, 2700)]),
+    ({2500}, [(2400, 2500), (2500, 2600)]),
+    ({2500, 2600}, [(2400, 2500), (2500, 2600), (2600, 2700)]),
+    ({2400, 2700}, [(2400, 2500), (2600, 2700)]),
+])
+def test_changed_pairs(changed, expected):
+    assert app.adjacent_pairs(STRIKES, changed) == expected
+
+
+def test_single_strike_has_no_pairs():
+    assert app.adjacent_pairs([2500], {2500}) == []
+
+
+def test_scan_covers_only_ticked_pairs(bot, scanned):
+    tick(bot, 2700, side="P")
+    bot.check_arbitrage_same_expiry()
+    assert scanned == [[(2600, 2700)]]
+    assert bot.dirty_strikes == set()
+
+
+def test_inserted_strike_pairs_with_both_neighbours(bot, scanned):
+    tick(bot, 2550)
+    assert bot.sorted_strikes == [2400, 2500, 2550, 2600, 2700]
+    bot.check_arbitrage_same_expiry()
+    assert scanned == [[(2500, 2550), (2550, 2600)]]
+
+
+def test_untouched_pairs_wait_for_full_scan(bot, scanned):
+    bot.check_arbitrage_same_expiry()
+    assert scanned == []
+
+    bot.last_full_scan = time.monotonic() - app.ARBITRAGE_FULL_SCAN_INTERVAL
+    bot.check_arbitrage_same_expiry()
+    assert scanned == [[(2400, 2500), (2500, 2600), (2600, 2700)]]
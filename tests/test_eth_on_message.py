@@ -0,0 +1,56 @@
+import time
+
+import app
+
+SYMBOL = "C-ETH-2500-170326"
+
+
+def make_bot():
+    bot = app.ETHWebSocketBot()
+    bot.active_expiry = "170326"
+    bot.subscribed_symbols = frozenset({SYMBOL})
+    # Keep the 2s System 1-3 checks out of these tests
+    bot.last_arbitrage_check = time.monotonic()
+    return bot
+
+
+def test_bytes_control_frame_is_skipped():
+    bot = make_bot()
+    bot.on_message(None, b'{"type":"heartbeat"}')
+    assert bot.options_prices == {}
+
+
+def test_bytes_quote_frame_passes_prefilter():
+    bot = make_bot()
+    frame = ('{"type":"l1_orderbook","symbol":"%s","best_bid":"10.5","best_ask":"11"}' % SYMBOL).encode()
+    bot.on_message(None, frame)
+    quote = bot.options_prices[SYMBOL]
+    assert (quote.bid, quote.ask) == (10.5, 11.0)
+
+
+def test_bytes_quote_frame_reaches_strike_index():
+    bot = make_bot()
+    frame = ('{"type":"l1_orderbook","symbol":"%s","best_bid":"10.5","best_ask":"11"}' % SYMBOL).encode()
+    bot.on_message(None, frame)
+    assert bot.sorted_strikes == [2500]
+    assert bot.strikes[2500]['call'].ask == 11.0
+    assert 2500 in bot.dirty_strikes
+
+
+def test_undecodable_bytes_frame_is_dropped():
+    bot = make_bot()
+    # Not valid UTF-8; with validation skipped this reaches on_message as-is
+    bot.on_message(None, b'{"symbol":"\xff\xfe"}')
+    assert bot.options_prices == {}
+
+
+def test_bytes_subscriptions_ack_is_handled():
+    bot = make_bot()
+    bot.on_message(None, b'{"type":"subscriptions","channels":[]}')
+    assert bot.options_prices == {}
+
+
+def test_str_frames_still_work():
+    bot = make_bot()
+    bot.on_message(None, '{"type":"l1_orderbook","symbol":"%s","best_bid":"1","best_ask":"2"}' % SYMBOL)
+    assert bot.options_prices[SYMBOL].bid == 1.0
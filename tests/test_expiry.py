@@ -0,0 +1,41 @@
+import pytest
+
+import app
+
+
+@pytest.fixture
+def products(monkeypatch):
+    symbols = [
+        "C-ETH-2500-010426",
+        "P-ETH-2500-310326",
+        "C-ETH-2600-150426",
+        "C-BTC-90000-280326",
+        "C-ETH-2600-310326",
+    ]
+    monkeypatch.setattr(app, "fetch_live_option_products",
+                        lambda: [{"symbol": symbol} for symbol in symbols])
+
+
+def test_live_expiries_sorted_by_date(products):
+    assert app.get_live_expiries("ETH") == ["310326", "010426", "150426"]
+    assert app.get_live_expiries("BTC") == ["280326"]
+
+
+def test_live_expiries_empty_when_fetch_fails(monkeypatch):
+    monkeypatch.setattr(app, "fetch_live_option_products", lambda: None)
+    assert app.get_live_expiries("ETH") == []
+
+
+@pytest.mark.parametrize("bot", [app.ETHWebSocketBot, app.BTCRESTBot])
+def test_next_expiry_across_month_boundary(bot):
+    assert bot().get_next_available_expiry("310326", ["310326", "010426"]) == "010426"
+
+
+def test_next_expiry_from_live_products(products):
+    assert app.ETHWebSocketBot().get_next_available_expiry("310326") == "010426"
+    assert app.ETHWebSocketBot().get_next_available_expiry("010426") == "150426"
+
+
+def test_next_expiry_past_the_last_keeps_the_last():
+    bot = app.ETHWebSocketBot()
+    assert bot.get_next_available_expiry("300426", ["310326", "010426"]) == "010426"
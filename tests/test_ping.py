@@ -0,0 +1,46 @@
+import pytest
+
+import app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app.eth_bot, "ready", app.Readiness())
+    monkeypatch.setattr(app.btc_bot, "ready", app.Readiness())
+    monkeypatch.setattr(app.eth_bot, "should_reconnect", True)
+    monkeypatch.setattr(app.btc_bot, "running", True)
+    return app.app.test_client()
+
+
+def expire_grace(readiness):
+    readiness.changed_at -= app.PING_NOT_READY_GRACE + 1
+
+
+def test_ping_ok_while_starting(client):
+    assert client.get("/ping").status_code == 200
+
+
+def test_ping_ok_when_ready(client):
+    app.eth_bot.ready.set()
+    app.btc_bot.ready.set()
+    assert client.get("/ping").status_code == 200
+
+
+def test_ping_fails_after_disconnect_outlasts_grace(client):
+    app.eth_bot.ready.set()
+    app.eth_bot.ready.clear()
+    expire_grace(app.eth_bot.ready)
+    assert client.get("/ping").status_code == 503
+
+
+def test_stopped_btc_bot_does_not_fail_ping(client, monkeypatch):
+    monkeypatch.setattr(app.btc_bot, "running", False)
+    expire_grace(app.btc_bot.ready)
+    assert client.get("/ping").status_code == 200
+
+
+def test_restart_resets_grace():
+    readiness = app.Readiness()
+    expire_grace(readiness)
+    readiness.restart()
+    assert readiness.not_ready_for() < app.PING_NOT_READY_GRACE
@@ -0,0 +1,116 @@
+import pytest
+
+import app
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.body = body
+
+    def json(self):
+        if self.body is None:
+            raise ValueError("no JSON body")
+        return self.body
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Record what post_telegram sends; responses are popped from `statuses`
+    (a status code, or a (status, body) pair)"""
+    calls = []
+    statuses = []
+
+    def fake_post(url, data, **kwargs):
+        calls.append(dict(data))
+        status = statuses.pop(0)
+        if isinstance(status, tuple):
+            return FakeResponse(*status)
+        return FakeResponse(status)
+
+    monkeypatch.setattr(app, "TELEGRAM_BOT_TOKEN", "token")
+    monkeypatch.setattr(app, "TELEGRAM_CHAT_ID", "chat")
+    monkeypatch.setattr(app, "wait_for_telegram_slot", lambda: None)
+    monkeypatch.setattr(app.telegram_session, "post", fake_post)
+    return calls, statuses
+
+
+@pytest.fixture
+def slept(monkeypatch):
+    delays = []
+    monkeypatch.setattr(app, "sleep", delays.append)
+    return delays
+
+
+def test_bad_markdown_resent_as_plain_text(sent):
+    calls, statuses = sent
+    statuses.extend([400, 200])
+    app.post_telegram("*unbalanced")
+    assert len(calls) == 2
+    assert calls[0]["parse_mode"] == "Markdown"
+    assert "parse_mode" not in calls[1]
+    assert calls[1]["text"] == "*unbalanced"
+
+
+def test_plain_text_400_is_not_retried(sent):
+    calls, statuses = sent
+    statuses.extend([400, 400])
+    app.post_telegram("*unbalanced")
+    assert len(calls) == 2
+
+
+def test_429_honours_string_retry_after(sent, slept):
+    calls, statuses = sent
+    statuses.extend([(429, {"parameters": {"retry_after": "3"}}), 200])
+    app.post_telegram("hi")
+    assert slept == [3.0]
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("body", [None, [], {"parameters": None}, {"parameters": {"retry_after": "soon"}}])
+def test_429_with_malformed_body_backs_off_one_second(sent, slept, body):
+    calls, statuses = sent
+    statuses.extend([(429, body), 200])
+    app.post_telegram("hi")
+    assert slept == [1]
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("retry_after, expected", [(86400, app.TELEGRAM_MAX_RETRY_AFTER), (-5, 1), ("nan", 1)])
+def test_429_retry_after_is_clamped(sent, slept, retry_after, expected):
+    calls, statuses = sent
+    statuses.extend([(429, {"parameters": {"retry_after": retry_after}}), 200])
+    app.post_telegram("hi")
+    assert slept == [expected]
+
+
+def test_gives_up_after_three_attempts(sent, slept):
+    calls, statuses = sent
+    statuses.extend([400, 429, 429])
+    app.post_telegram("*unbalanced")
+    assert len(calls) == 3
+
+
+def test_long_message_split_at_line_breaks():
+    line = "x" * 99
+    message = "\n".join([line] * 100)
+    pieces = app.split_telegram_message(message)
+    assert len(pieces) > 1
+    assert all(len(piece) <= app.TELEGRAM_MAX_MESSAGE_LENGTH for piece in pieces)
+    assert all(piece.startswith("x") for piece in pieces)
+    assert "\n".join(pieces) == message
+
+
+def test_long_line_hard_split():
+    message = "x" * (app.TELEGRAM_MAX_MESSAGE_LENGTH * 2 + 1)
+    pieces = app.split_telegram_message(message)
+    assert [len(piece) for piece in pieces] == [
+        app.TELEGRAM_MAX_MESSAGE_LENGTH, app.TELEGRAM_MAX_MESSAGE_LENGTH, 1
+    ]
+
+
+def test_batch_chunks_stay_under_limit():
+    oversized = "y" * (app.TELEGRAM_MAX_MESSAGE_LENGTH + 10)
+    chunks = app.join_telegram_batch(["short", oversized, "tail"])
+    assert all(len(chunk) <= app.TELEGRAM_MAX_MESSAGE_LENGTH for chunk in chunks)
+    assert "".join(chunks).count("y") == len(oversized)